@@ -11,14 +11,287 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import streamlit as st
+import numpy as np
 import pandas as pd
+import atexit
+import io
 import json
+import os
+import threading
+
+from dataclasses import asdict, fields
+
+try:
+    # orjson is an optional accelerator for the persistence file; the stdlib
+    # json module is the fallback and produces the same on-disk format.
+    import orjson
+except ImportError:
+    orjson = None
 
 from retire_sim.model import Params, simulate
-from retire_sim.search import find_earliest_retirement, find_earliest_joint_retirement, compare_scenarios, find_max_monthly_expense
-from retire_sim.plots import plot_combined
 from retire_sim.israeli_tax import calculate_monthly_tax_from_gross, get_effective_tax_rate
 
+# retire_sim.plots (which pulls in plotly) and retire_sim.search are imported
+# lazily inside the cached wrappers below, keeping them off the cold-start
+# path; Python caches the module so later calls pay nothing.
+
+# File used to persist sidebar inputs between sessions
+PERSIST_FILE = Path.home() / '.financial_life_planner_session.json'
+
+# Mandatory Israeli contribution rates - fixed by law, not user-configurable
+PENSION_EMPLOYEE_RATE = 0.06     # 6% employee pension contribution
+PENSION_EMPLOYER_RATE = 0.125    # 12.5% employer pension contribution
+HISHTALMUT_EMPLOYEE_RATE = 0.025  # 2.5% employee hishtalmut contribution
+HISHTALMUT_EMPLOYER_RATE = 0.075  # 7.5% employer hishtalmut contribution
+
+# Static markdown for the tax info expander, hoisted to module level so the
+# strings are built once at import instead of on every rerun
+_TAX_BRACKETS_MD = """
+- ₪0 - ₪84,120: **10%**
+- ₪84,120 - ₪120,720: **14%**
+- ₪120,720 - ₪193,800: **20%**
+- ₪193,800 - ₪269,280: **31%**
+- ₪269,280 - ₪560,280: **35%**
+- ₪560,280 - ₪721,560: **47%**
+- Above ₪721,560: **50%**
+"""
+
+_NATIONAL_INSURANCE_MD = """
+- Up to ₪7,522/month: **4.27%** (NI 1.04% + Health 3.23%)
+- ₪7,522 - ₪50,695/month: **12.17%** (NI 7.00% + Health 5.17%)
+- Cap at ₪50,695/month
+"""
+
+_PENSION_CONTRIBUTIONS_MD = """
+- **Employee contribution:** 6% of gross salary (deducted from paycheck)
+- **Employer contribution:** 12.5% of gross salary (not deducted from paycheck)
+- **Total pension accumulation:** 18.5% of gross salary
+
+Note: This is mandatory by Israeli law. The simulation uses these rates by default.
+"""
+
+_NET_INCOME_MD = """
+Net to Hand = Gross - Income Tax - National Insurance - Employee Pension (6%)
+
+Example for ₪30,000 gross:
+- Income Tax: ~₪6,942/month
+- National Insurance: ~₪3,020/month
+- Employee Pension (6%): ₪1,800/month
+- **Net to Hand: ~₪18,238/month**
+- Employer adds ₪3,750/month to pension (12.5%)
+- **Total Pension: ₪5,550/month (18.5%)**
+"""
+
+
+def load_persisted_session():
+    """Load persisted configuration into session state (first run only)."""
+    if st.session_state.get('_session_loaded'):
+        return
+    st.session_state['_session_loaded'] = True
+
+    if PERSIST_FILE.exists():
+        try:
+            with open(PERSIST_FILE, 'rb') as f:
+                raw = f.read()
+            config = orjson.loads(raw) if orjson else json.loads(raw)
+            import_config_from_dict(config)
+        except Exception:
+            # Corrupt or unreadable file - fall back to defaults
+            pass
+
+
+def _write_json(path: Path, data: dict):
+    """Write JSON atomically (tmp file + os.replace)."""
+    if orjson:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    tmp_path = path.with_suffix('.json.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def save_persisted_session():
+    """Persist the current configuration, skipping writes when nothing changed.
+
+    Called only on explicit events (sidebar form submit), so the write is
+    gated behind a content-hash comparison and handed off to a daemon thread
+    to keep disk I/O out of the render path.
+    """
+    data = export_config_to_dict()
+    if orjson:
+        content_hash = hash(orjson.dumps(data, option=orjson.OPT_SORT_KEYS))
+    else:
+        content_hash = hash(json.dumps(data, sort_keys=True))
+    if st.session_state.get('_persist_hash') == content_hash:
+        return
+
+    st.session_state['_persist_hash'] = content_hash
+    threading.Thread(target=_write_json, args=(PERSIST_FILE, data), daemon=True).start()
+
+
+# Snapshot of the latest configuration, refreshed each rerun and flushed by
+# the atexit hook below. Kept outside session state so the hook can reach it
+# after the script-run context is gone.
+_last_config: dict = {}
+
+
+def _save_on_exit():
+    """Flush the most recent configuration synchronously at interpreter exit."""
+    if _last_config:
+        try:
+            _write_json(PERSIST_FILE, _last_config)
+        except Exception:
+            pass
+
+
+# atexit is only reliable for a single-user local run; multi-user cloud
+# deployments rely on the form-submit save instead.
+if os.environ.get('FLP_SINGLE_USER'):
+    atexit.register(_save_on_exit)
+
+
+def params_to_key(params: Params) -> tuple:
+    """Build a hashable canonical key from Params for st.cache_data.
+
+    The simulation is deterministic, so a tuple of the (sorted) field values
+    uniquely identifies a run. List fields (schedules, events) are converted
+    to tuples so the key is hashable.
+    """
+    init_fields = {f.name for f in fields(Params) if f.init}
+    items = []
+    for field_name, value in sorted(asdict(params).items()):
+        if field_name not in init_fields:
+            # Derived fields (precomputed in __post_init__) are not
+            # constructor arguments and are determined by the rest
+            continue
+        if isinstance(value, list):
+            value = tuple(tuple(entry) for entry in value)
+        items.append((field_name, value))
+    return tuple(items)
+
+
+def params_from_key(params_key: tuple) -> Params:
+    """Reconstruct Params from a key built by params_to_key."""
+    return Params(**dict(params_key))
+
+
+@st.cache_resource(show_spinner=False)
+def build_params(params_key: tuple) -> Params:
+    """Memoized Params construction keyed on the canonical field tuple.
+
+    The sidebar rebuilds Params with 35+ kwargs on every rerun; reruns
+    triggered by unrelated UI (tab switches, button clicks) reuse the
+    previous instance instead. The key uses the params_to_key format.
+    """
+    return params_from_key(params_key)
+
+
+@st.cache_data(show_spinner=False)
+def derived_tax_metrics(gross1: float, gross2: float) -> tuple:
+    """Cached (tax, net, effective-rate) per person for the sidebar metrics."""
+    tax_p1 = calculate_monthly_tax_from_gross(gross1)
+    tax_p2 = calculate_monthly_tax_from_gross(gross2)
+    return (tax_p1, gross1 - tax_p1, get_effective_tax_rate(gross1),
+            tax_p2, gross2 - tax_p2, get_effective_tax_rate(gross2))
+
+
+@st.cache_data(show_spinner=False)
+def cached_simulate(params_key: tuple, retire_age: float, spouse_retire_age: float):
+    """Cached wrapper around simulate keyed on the full parameter set."""
+    return simulate(retire_age, params_from_key(params_key), spouse_retire_age)
+
+
+@st.cache_data(show_spinner=False)
+def cached_find_earliest_retirement(params_key: tuple, spouse_retire_age: float):
+    """Cached wrapper around find_earliest_retirement_vec."""
+    from retire_sim.search import find_earliest_retirement_vec
+    return find_earliest_retirement_vec(params_from_key(params_key), spouse_retire_age=spouse_retire_age)
+
+
+@st.cache_data(show_spinner=False)
+def cached_find_earliest_joint_retirement(params_key: tuple):
+    """Cached wrapper around find_earliest_joint_retirement_vec."""
+    from retire_sim.search import find_earliest_joint_retirement_vec
+    return find_earliest_joint_retirement_vec(params_from_key(params_key))
+
+
+@st.cache_data(show_spinner=False)
+def cached_compare_scenarios(params_key: tuple, retirement_ages: tuple, spouse_retire_age: float):
+    """Cached wrapper around compare_scenarios."""
+    from retire_sim.search import compare_scenarios
+    return compare_scenarios(params_from_key(params_key), list(retirement_ages), spouse_retire_age)
+
+
+@st.cache_data(show_spinner=False)
+def cached_find_max_monthly_expense(params_key: tuple, target_end_assets: float,
+                                    retire_age: float, spouse_retire_age: float):
+    """Cached wrapper around find_max_monthly_expense."""
+    from retire_sim.search import find_max_monthly_expense
+    return find_max_monthly_expense(
+        params_from_key(params_key),
+        target_end_assets,
+        retire_age=retire_age,
+        spouse_retire_age=spouse_retire_age
+    )
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=16,  # figures are large; bound the cache instead of growing per run
+    hash_funcs={pd.DataFrame: lambda df: pd.util.hash_pandas_object(df, index=False).values.tobytes()}
+)
+def cached_plot_combined(df: pd.DataFrame, retire_age1: float, retire_age2: float,
+                         pension_start_age1: float, pension_start_age2: float,
+                         income_schedule1, income_schedule2, one_time_events, expense_schedule):
+    """Cached wrapper around plot_combined keyed on the DataFrame contents.
+
+    Rebuilding the figure is Python-heavy (thousands of trace points across
+    two subplots), and reruns triggered by unrelated widgets would otherwise
+    redo it for an identical result.
+    """
+    from retire_sim.plots import plot_combined
+    return plot_combined(df, retire_age1, retire_age2,
+                         pension_start_age1, pension_start_age2,
+                         income_schedule1, income_schedule2,
+                         one_time_events, expense_schedule)
+
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: lambda df: pd.util.hash_pandas_object(df, index=False).values.tobytes()}
+)
+def df_to_csv(df: pd.DataFrame) -> bytes:
+    """Cached CSV serialization for the download buttons.
+
+    Streamlit evaluates expander bodies on every rerun even when collapsed,
+    so without caching the full DataFrame is re-serialized each time whether
+    or not the user ever downloads it. Writing into a BytesIO with a fixed
+    float_format skips the per-cell repr formatting and hands
+    st.download_button ready-to-send bytes (amounts are in shekels, so two
+    decimals lose nothing meaningful).
+    """
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, float_format='%.2f')
+    return buf.getvalue()
+
+
+def windowed_view(df: pd.DataFrame, head: int = 120, tail: int = 120) -> pd.DataFrame:
+    """First and last rows of a long frame for on-screen display.
+
+    Caps the Arrow payload st.dataframe ships to the frontend on every
+    rerun; the CSV download keeps the full data.
+    """
+    if len(df) <= head + tail:
+        return df
+    return pd.concat([df.head(head), df.tail(tail)])
+
+
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: lambda df: pd.util.hash_pandas_object(df, index=False).values.tobytes()}
+)
 def convert_to_annual_data(df):
     """Convert monthly dataframe to annual data by grouping every 12 months."""
     if df.empty:
@@ -87,9 +360,14 @@ def convert_to_annual_data(df):
     return df_annual
 
 
+@st.fragment
 def render_income_schedule_ui(person_id: str, current_age: float, gross_income: float) -> list:
     """Render income schedule UI for a person and return the schedule list.
 
+    Runs as a fragment: grid edits rerun only this editor instead of the
+    whole script. Changes land in session state, so the outer script picks
+    them up on its next full rerun.
+
     Args:
         person_id: 'p1' or 'p2' to distinguish between Person 1 and 2
         current_age: Current age of the person
@@ -110,37 +388,33 @@ def render_income_schedule_ui(person_id: str, current_age: float, gross_income:
                                    key=f'{person_id}_enable_schedule',
                                    help="Specify income changes over time (e.g., part-time transitions)")
 
-    # Return schedule regardless of checkbox (if it has entries)
-    schedule = st.session_state[session_key] if st.session_state[session_key] else None
-
     if enable_schedule:
         st.markdown("**Income Schedule**")
 
-        # Show existing entries
-        for idx, (age, income) in enumerate(st.session_state[session_key]):
-            col_age, col_income, col_del = st.columns([2, 2, 1])
-            col_age.text(f"Age {age}")
-            col_income.text(f"₪{income/1000:.1f}K")
-            if col_del.button("🗑️", key=f'{person_id}_del_{idx}'):
-                st.session_state[session_key].pop(idx)
-                st.rerun()
-
-        # Add new entry
-        col_add_age, col_add_income = st.columns(2)
-        new_age = col_add_age.number_input("Add at Age", min_value=current_age, max_value=100.0,
-                                           value=current_age + 5, step=1.0, key=f'{person_id}_new_age',
-                                           help="Age at which income changes")
-        new_income = col_add_income.number_input("Income (₪K)", min_value=0.0,
-                                                 value=gross_income / 2000, step=1.0,
-                                                 format="%.1f", key=f'{person_id}_new_income',
-                                                 help="New gross monthly income from this age") * 1000
-
-        if st.button("➕ Add Income Change", key=f'{person_id}_add_schedule'):
-            st.session_state[session_key].append((new_age, new_income))
-            st.session_state[session_key].sort(key=lambda x: x[0])
-            st.rerun()
+        # Single editable grid instead of one row of widgets per entry
+        df = pd.DataFrame(st.session_state[session_key], columns=['age', 'income'])
+        edited = st.data_editor(
+            df,
+            num_rows="dynamic",
+            hide_index=True,
+            key=f'{person_id}_schedule_editor',
+            column_config={
+                'age': st.column_config.NumberColumn(
+                    "Age", min_value=current_age, max_value=100.0, step=1.0,
+                    help="Age at which income changes"),
+                'income': st.column_config.NumberColumn(
+                    "Gross Income (₪)", min_value=0.0, step=500.0, format="₪%d",
+                    help="New gross monthly income from this age"),
+            },
+        )
 
-    return schedule
+        updated = [(float(age), float(income)) for age, income in edited.dropna().itertuples(index=False)]
+        updated.sort(key=lambda entry: entry[0])
+        if updated != st.session_state[session_key]:
+            st.session_state[session_key] = updated
+
+    # Return schedule regardless of checkbox (if it has entries)
+    return st.session_state[session_key] if st.session_state[session_key] else None
 
 
 def export_config_to_dict() -> dict:
@@ -214,9 +488,12 @@ def import_config_from_dict(config: dict):
             st.session_state[session_key] = config[config_key]
 
 
+@st.fragment
 def render_expense_schedule_ui(current_age: float, end_age: float, base_expense: float) -> list:
     """Render expense schedule UI and return the schedule list.
 
+    Runs as a fragment (see render_income_schedule_ui).
+
     Args:
         current_age: Current age of Person 1 (expenses are relative to Person 1)
         end_age: End age of simulation
@@ -237,42 +514,41 @@ def render_expense_schedule_ui(current_age: float, end_age: float, base_expense:
                                    key='enable_expense_schedule',
                                    help="Specify expense changes over time (e.g., reducing expenses in retirement)")
 
-    # Return schedule regardless of checkbox (if it has entries)
-    schedule = st.session_state[session_key] if st.session_state[session_key] else None
-
     if enable_schedule:
         st.markdown("**Expense Schedule**")
 
-        # Show existing entries
-        for idx, (age, expense) in enumerate(st.session_state[session_key]):
-            col_age, col_expense, col_del = st.columns([2, 2, 1])
-            col_age.text(f"Age {age}")
-            col_expense.text(f"₪{expense/1000:.1f}K")
-            if col_del.button("🗑️", key=f'expense_del_{idx}'):
-                st.session_state[session_key].pop(idx)
-                st.rerun()
-
-        # Add new entry
-        col_add_age, col_add_expense = st.columns(2)
-        new_age = col_add_age.number_input("Add at Age", min_value=current_age, max_value=end_age,
-                                           value=current_age + 5, step=1.0, key='new_expense_age',
-                                           help="Age at which monthly expense changes")
-        new_expense = col_add_expense.number_input("Expense (₪K)", min_value=0.0,
-                                                   value=base_expense / 1000 * 0.8, step=1.0,
-                                                   format="%.1f", key='new_expense_amount',
-                                                   help="New monthly expense from this age") * 1000
-
-        if st.button("➕ Add Expense Change", key='add_expense_schedule'):
-            st.session_state[session_key].append((new_age, new_expense))
-            st.session_state[session_key].sort(key=lambda x: x[0])
-            st.rerun()
+        # Single editable grid instead of one row of widgets per entry
+        df = pd.DataFrame(st.session_state[session_key], columns=['age', 'expense'])
+        edited = st.data_editor(
+            df,
+            num_rows="dynamic",
+            hide_index=True,
+            key='expense_schedule_editor',
+            column_config={
+                'age': st.column_config.NumberColumn(
+                    "Age", min_value=current_age, max_value=end_age, step=1.0,
+                    help="Age at which monthly expense changes"),
+                'expense': st.column_config.NumberColumn(
+                    "Monthly Expense (₪)", min_value=0.0, step=500.0, format="₪%d",
+                    help="New monthly expense from this age"),
+            },
+        )
+
+        updated = [(float(age), float(expense)) for age, expense in edited.dropna().itertuples(index=False)]
+        updated.sort(key=lambda entry: entry[0])
+        if updated != st.session_state[session_key]:
+            st.session_state[session_key] = updated
 
-    return schedule
+    # Return schedule regardless of checkbox (if it has entries)
+    return st.session_state[session_key] if st.session_state[session_key] else None
 
 
+@st.fragment
 def render_one_time_events_ui(current_age: float, end_age: float) -> list:
     """Render one-time events UI and return the events list.
 
+    Runs as a fragment (see render_income_schedule_ui).
+
     Args:
         current_age: Current age of Person 1 (events are relative to Person 1)
         end_age: End age of simulation
@@ -291,54 +567,38 @@ def render_one_time_events_ui(current_age: float, end_age: float) -> list:
     enable_events = st.checkbox("One-Time Events", value=has_events, key='enable_one_time_events',
                                 help="Add one-time income (inheritance, bonus) or expenses (home purchase, car)")
 
-    # Always return events if they exist, regardless of checkbox
-    events = st.session_state[session_key] if st.session_state[session_key] else None
-
     if enable_events:
-        st.markdown("_Events are applied at Person 1's age_")
-
-        # Show existing events
-        if st.session_state[session_key]:
-            st.markdown("**Existing Events:**")
-            for idx, (age, amount, desc) in enumerate(st.session_state[session_key]):
-                col_age, col_amount, col_desc, col_del = st.columns([1, 2, 3, 1])
-                col_age.text(f"Age {age:.0f}")
-                event_type = "Income" if amount > 0 else "Expense"
-                col_amount.text(f"₪{abs(amount)/1000:.0f}K ({event_type})")
-                col_desc.text(desc)
-                if col_del.button("🗑️", key=f'event_del_{idx}'):
-                    st.session_state[session_key].pop(idx)
-                    st.rerun()
-
-        # Add new event
-        st.markdown("**Add New Event:**")
-        col_age, col_amount, col_type = st.columns(3)
-
-        new_event_age = col_age.number_input("At Age", min_value=current_age, max_value=end_age,
-                                             value=current_age + 10, step=1.0, key='new_event_age',
-                                             help="Person 1's age when event occurs")
-        new_event_amount_abs = col_amount.number_input("Amount (₪K)", min_value=0.0,
-                                                       value=100.0, step=10.0,
-                                                       format="%.0f", key='new_event_amount',
-                                                       help="Amount of one-time income or expense") * 1000
-        event_type = col_type.selectbox("Type", ["Income", "Expense"], key='new_event_type',
-                                        help="Income adds to assets, expense reduces assets")
-
-        new_event_desc = st.text_input("Description", value="", placeholder="e.g., Home purchase, Inheritance, etc.",
-                                       key='new_event_desc',
-                                       help="Brief description of the event")
-
-        if st.button("➕ Add Event", key='add_event'):
-            if new_event_desc.strip():
-                # Make amount negative for expenses
-                amount = new_event_amount_abs if event_type == "Income" else -new_event_amount_abs
-                st.session_state[session_key].append((new_event_age, amount, new_event_desc))
-                st.session_state[session_key].sort(key=lambda x: x[0])
-                st.rerun()
-            else:
-                st.warning("Please enter a description for the event")
+        st.markdown("_Events are applied at Person 1's age. Positive amounts are income, negative are expenses._")
+
+        # Single editable grid instead of one row of widgets per event
+        df = pd.DataFrame(st.session_state[session_key], columns=['age', 'amount', 'description'])
+        edited = st.data_editor(
+            df,
+            num_rows="dynamic",
+            hide_index=True,
+            key='one_time_events_editor',
+            column_config={
+                'age': st.column_config.NumberColumn(
+                    "Age", min_value=current_age, max_value=end_age, step=1.0,
+                    help="Person 1's age when event occurs"),
+                'amount': st.column_config.NumberColumn(
+                    "Amount (₪)", step=10000.0, format="₪%d",
+                    help="Positive = income (inheritance, bonus), negative = expense (home purchase, car)"),
+                'description': st.column_config.TextColumn(
+                    "Description",
+                    help="Brief description of the event"),
+            },
+        )
 
-    return events
+        edited = edited.dropna(subset=['age', 'amount'])
+        updated = [(float(age), float(amount), str(desc) if pd.notna(desc) else '')
+                   for age, amount, desc in edited.itertuples(index=False)]
+        updated.sort(key=lambda entry: entry[0])
+        if updated != st.session_state[session_key]:
+            st.session_state[session_key] = updated
+
+    # Always return events if they exist, regardless of checkbox
+    return st.session_state[session_key] if st.session_state[session_key] else None
 
 
 def main():
@@ -351,6 +611,9 @@ def main():
     st.title("💰 Financial Life Planner")
     st.markdown("Plan your financial future for you and your spouse with different scenarios and life events.")
 
+    # Restore persisted inputs before any widgets are created
+    load_persisted_session()
+
     # Sidebar for parameters
     with st.sidebar:
         st.header("Parameters")
@@ -358,13 +621,17 @@ def main():
         # Use hardcoded defaults from Params dataclass
         defaults = Params()
 
+        # Local aliases: avoid repeated attribute lookups on the session-state
+        # proxy for the ~20 widget defaults read on every rerun
+        ss = st.session_state
+
         # Shared parameters at the top
         st.subheader("Shared Parameters")
 
         # Reset button
         if st.button("🔄 Reset", help="Clear session state and reset to default parameters"):
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
+            ss.clear()
+            PERSIST_FILE.unlink(missing_ok=True)
             st.rerun()
 
         # Export/Import JSON (collapsible)
@@ -391,11 +658,11 @@ def main():
                 )
                 if uploaded_file is not None:
                     file_id = (uploaded_file.name, uploaded_file.size)
-                    if st.session_state.get('_last_imported_file') != file_id:
+                    if ss.get('_last_imported_file') != file_id:
                         try:
                             config_data = json.load(uploaded_file)
                             import_config_from_dict(config_data)
-                            st.session_state['_last_imported_file'] = file_id
+                            ss['_last_imported_file'] = file_id
                             st.success("✅ JSON imported!")
                             st.rerun()
                         except Exception as e:
@@ -405,114 +672,119 @@ def main():
 
         st.divider()
 
-        end_age = st.number_input("End Age (Planning Horizon)", min_value=50.0, max_value=120.0, value=st.session_state.get('end_age', defaults.end_age), step=1.0, key='end_age', help="Age to plan until (simulation stops here)")
-        r_annual_real = st.slider("Real Annual Return (%)", min_value=0.0, max_value=10.0, value=st.session_state.get('returns', defaults.r_annual_real * 100), step=0.25, key='returns', help="Expected annual investment return after inflation (real return)") / 100
-        liquid_now = st.number_input("Assets (exc. pension) (₪K)", min_value=0.0, value=st.session_state.get('liquid', defaults.liquid_now / 1000), step=10.0, format="%.1f", key='liquid', help="Current liquid assets (savings, stocks, bonds) excluding pension accounts") * 1000
-
-        # Calculate default nontaxable amount
-        default_nontaxable_amount = (defaults.liquid_now * defaults.liquid_nontaxable_pct) / 1000
-        liquid_nontaxable_amount = st.number_input("Assets Already Post-Tax (₪K)", min_value=0.0, max_value=liquid_now/1000, value=st.session_state.get('liquid_nontaxable_amount', default_nontaxable_amount), step=10.0, format="%.1f", key='liquid_nontaxable_amount', help="Amount of liquid assets that are already post-tax (e.g., regular savings, Keren Hishtalmut, Roth accounts). Income is added to this portion. Only the remaining taxable portion incurs withdrawal tax.") * 1000
-
-        # Calculate percentage for internal use
-        liquid_nontaxable_pct = liquid_nontaxable_amount / liquid_now if liquid_now > 0 else 1.0
-        min_assets = st.number_input("Minimum Assets (₪K)", min_value=0.0, value=st.session_state.get('min_assets', defaults.min_assets / 1000), step=100.0, format="%.0f", key='min_assets', help="Assets cannot fall below this level") * 1000
-        liquid_withdrawal_tax_rate = st.slider("Liquid Withdrawal Tax (%)", min_value=0.0, max_value=50.0, value=st.session_state.get('liquid_withdrawal_tax', defaults.liquid_withdrawal_tax_rate * 100), step=0.5, key='liquid_withdrawal_tax', help="Tax rate applied to taxable portion when withdrawing from liquid assets (e.g., capital gains tax on pre-tax investments). Only affects the taxable portion of withdrawals.") / 100
+        # Batch all parameter inputs into a single form: edits inside it do
+        # not rerun the script until "Apply Changes" is submitted, instead of
+        # one full rerun per keystroke or slider tick.
+        with st.form("sidebar_params"):
+            end_age = st.number_input("End Age (Planning Horizon)", min_value=50.0, max_value=120.0, value=ss.get('end_age', defaults.end_age), step=1.0, key='end_age', help="Age to plan until (simulation stops here)")
+            r_annual_real = st.slider("Real Annual Return (%)", min_value=0.0, max_value=10.0, value=ss.get('returns', defaults.r_annual_real * 100), step=0.25, key='returns', help="Expected annual investment return after inflation (real return)") / 100
+            liquid_now = st.number_input("Assets (exc. pension) (₪K)", min_value=0.0, value=ss.get('liquid', defaults.liquid_now / 1000), step=10.0, format="%.1f", key='liquid', help="Current liquid assets (savings, stocks, bonds) excluding pension accounts") * 1000
+
+            # Calculate default nontaxable amount
+            default_nontaxable_amount = (defaults.liquid_now * defaults.liquid_nontaxable_pct) / 1000
+            liquid_nontaxable_amount = st.number_input("Assets Already Post-Tax (₪K)", min_value=0.0, max_value=liquid_now/1000, value=ss.get('liquid_nontaxable_amount', default_nontaxable_amount), step=10.0, format="%.1f", key='liquid_nontaxable_amount', help="Amount of liquid assets that are already post-tax (e.g., regular savings, Keren Hishtalmut, Roth accounts). Income is added to this portion. Only the remaining taxable portion incurs withdrawal tax.") * 1000
+
+            # Calculate percentage for internal use
+            liquid_nontaxable_pct = liquid_nontaxable_amount / liquid_now if liquid_now > 0 else 1.0
+            min_assets = st.number_input("Minimum Assets (₪K)", min_value=0.0, value=ss.get('min_assets', defaults.min_assets / 1000), step=100.0, format="%.0f", key='min_assets', help="Assets cannot fall below this level") * 1000
+            liquid_withdrawal_tax_rate = st.slider("Liquid Withdrawal Tax (%)", min_value=0.0, max_value=50.0, value=ss.get('liquid_withdrawal_tax', defaults.liquid_withdrawal_tax_rate * 100), step=0.5, key='liquid_withdrawal_tax', help="Tax rate applied to taxable portion when withdrawing from liquid assets (e.g., capital gains tax on pre-tax investments). Only affects the taxable portion of withdrawals.") / 100
+
+            st.divider()
+
+            # Monthly expenses (schedule editor lives below the form)
+            spend_month = st.number_input("Monthly Expense (₪K)", min_value=0.0, value=ss.get('spend', defaults.spend_month / 1000), step=1.0, format="%.1f", key='spend', help="Combined household monthly expense (in real terms, constant throughout simulation unless modified by expense schedule)") * 1000
+
+            st.divider()
+
+            # Person-specific parameters side by side
+            st.subheader("Person-Specific Parameters")
+
+            col_p1, col_p2 = st.columns(2)
+
+            with col_p1:
+                st.markdown("**Person 1**")
+                age_now = st.number_input("Current Age", min_value=18.0, max_value=100.0, value=ss.get('p1_age_now', defaults.age_now), step=1.0, key='p1_age_now', help="Current age (starting point of simulation)")
+                gross_income_month = st.number_input("Gross Income (₪K)", min_value=0.0, value=ss.get('p1_income', defaults.gross_income_month / 1000), step=1.0, format="%.1f", key='p1_income', help="Monthly gross income before tax (Israeli tax calculated automatically)") * 1000
+
+                retire_age = st.number_input("Retirement Age",
+                                            min_value=18.0,
+                                            max_value=100.0,
+                                            value=ss.get('p1_retire', defaults.retire_age),
+                                            step=1.0,
+                                            key='p1_retire',
+                                            help="Age to stop working (can be <= current age if already retired)")
+
+                pension_start_age = st.number_input("Pension Start Age", min_value=retire_age, max_value=100.0, value=ss.get('p1_pension', defaults.pension_start_age), step=1.0, key='p1_pension', help="Age to start receiving pension income (usually 67 in Israel)")
+
+                hishtalmut_salary_cap = defaults.hishtalmut_salary_cap
+
+                st.markdown("**Pension**")
+                pension_now = st.number_input("Pension Now (₪K)", min_value=0.0, value=ss.get('p1_pension_now', defaults.pension_now / 1000), step=10.0, format="%.1f", key='p1_pension_now', help="Current balance in pension account (Keren Pensia)") * 1000
+                mekadem = st.number_input(
+                    "Mekadem",
+                    min_value=1.0,
+                    value=ss.get('p1_mekadem', defaults.mekadem),
+                    step=1.0,
+                    format="%.0f",
+                    key='p1_mekadem',
+                    help="Divisor for pension income (Monthly pension = Balance / Mekadem)"
+                )
 
-        st.divider()
+            with col_p2:
+                st.markdown("**Person 2**")
+                spouse_age_now = st.number_input("Current Age", min_value=18.0, max_value=100.0, value=ss.get('p2_age_now', defaults.spouse_age_now), step=1.0, key='p2_age_now', help="Current age (starting point of simulation)")
+                spouse_gross_income_month = st.number_input("Gross Income (₪K)", min_value=0.0, value=ss.get('p2_income', defaults.spouse_gross_income_month / 1000), step=1.0, format="%.1f", key='p2_income', help="Monthly gross income before tax (Israeli tax calculated automatically)") * 1000
+
+                spouse_retire_age = st.number_input("Retirement Age",
+                                                   min_value=18.0,
+                                                   max_value=100.0,
+                                                   value=ss.get('p2_retire', defaults.spouse_retire_age),
+                                                   step=1.0,
+                                                   key='p2_retire',
+                                                   help="Age to stop working (can be <= current age if already retired)")
+
+                spouse_pension_start_age = st.number_input("Pension Start Age", min_value=spouse_retire_age, max_value=100.0, value=ss.get('p2_pension', defaults.spouse_pension_start_age), step=1.0, key='p2_pension', help="Age to start receiving pension income (usually 67 in Israel)")
+
+                spouse_hishtalmut_salary_cap = defaults.spouse_hishtalmut_salary_cap
+
+                st.markdown("**Pension**")
+                spouse_pension_now = st.number_input("Pension Now (₪K)", min_value=0.0, value=ss.get('p2_pension_now', defaults.spouse_pension_now / 1000), step=10.0, format="%.1f", key='p2_pension_now', help="Current balance in pension account (Keren Pensia)") * 1000
+                spouse_mekadem = st.number_input(
+                    "Mekadem",
+                    min_value=1.0,
+                    value=ss.get('p2_mekadem', defaults.spouse_mekadem),
+                    step=1.0,
+                    format="%.0f",
+                    key='p2_mekadem',
+                    help="Divisor for pension income (Monthly pension = Balance / Mekadem)"
+                )
 
-        # Get age_now to pass to the functions (need to read it early for this)
-        age_now_for_schedules = st.session_state.get('p1_age_now', defaults.age_now)
+            params_submitted = st.form_submit_button("Apply Changes", type="primary")
 
-        # Monthly expenses and expense schedule grouped together
-        spend_month = st.number_input("Monthly Expense (₪K)", min_value=0.0, value=st.session_state.get('spend', defaults.spend_month / 1000), step=1.0, format="%.1f", key='spend', help="Combined household monthly expense (in real terms, constant throughout simulation unless modified by expense schedule)") * 1000
+        # Schedule and event editors use regular buttons, which Streamlit
+        # does not allow inside a form, so they apply immediately below it
+        st.subheader("Schedules & Events")
 
         # Expense schedule
-        expense_schedule = render_expense_schedule_ui(age_now_for_schedules, end_age, spend_month)
+        expense_schedule = render_expense_schedule_ui(age_now, end_age, spend_month)
 
         # One-time events (income or expenses)
-        one_time_events = render_one_time_events_ui(age_now_for_schedules, end_age)
-
-        st.divider()
-
-        # Person-specific parameters side by side
-        st.subheader("Person-Specific Parameters")
+        one_time_events = render_one_time_events_ui(age_now, end_age)
 
-        col_p1, col_p2 = st.columns(2)
+        col_s1, col_s2 = st.columns(2)
 
-        with col_p1:
+        with col_s1:
             st.markdown("**Person 1**")
-            age_now = st.number_input("Current Age", min_value=18.0, max_value=100.0, value=st.session_state.get('p1_age_now', defaults.age_now), step=1.0, key='p1_age_now', help="Current age (starting point of simulation)")
-            gross_income_month = st.number_input("Gross Income (₪K)", min_value=0.0, value=st.session_state.get('p1_income', defaults.gross_income_month / 1000), step=1.0, format="%.1f", key='p1_income', help="Monthly gross income before tax (Israeli tax calculated automatically)") * 1000
-
-            # Income schedule UI
             income_schedule = render_income_schedule_ui('p1', age_now, gross_income_month)
 
-            retire_age = st.number_input("Retirement Age",
-                                        min_value=18.0,
-                                        max_value=100.0,
-                                        value=st.session_state.get('p1_retire', defaults.retire_age),
-                                        step=1.0,
-                                        key='p1_retire',
-                                        help="Age to stop working (can be <= current age if already retired)")
-
-            pension_start_age = st.number_input("Pension Start Age", min_value=retire_age, max_value=100.0, value=st.session_state.get('p1_pension', defaults.pension_start_age), step=1.0, key='p1_pension', help="Age to start receiving pension income (usually 67 in Israel)")
-
-            pension_rate = 0.06  # Fixed rate (6% employee contribution)
-            pension_rate_employer = 0.125  # Fixed rate (12.5% employer contribution)
-            hishtalmut_rate_employee = 0.025  # Fixed rate (2.5% employee contribution)
-            hishtalmut_rate_employer = 0.075  # Fixed rate (7.5% employer contribution)
-            hishtalmut_salary_cap = defaults.hishtalmut_salary_cap
-
-            st.markdown("**Pension**")
-            pension_now = st.number_input("Pension Now (₪K)", min_value=0.0, value=st.session_state.get('p1_pension_now', defaults.pension_now / 1000), step=10.0, format="%.1f", key='p1_pension_now', help="Current balance in pension account (Keren Pensia)") * 1000
-            mekadem = st.number_input(
-                "Mekadem",
-                min_value=1.0,
-                value=st.session_state.get('p1_mekadem', defaults.mekadem),
-                step=1.0,
-                format="%.0f",
-                key='p1_mekadem',
-                help="Divisor for pension income (Monthly pension = Balance / Mekadem)"
-            )
-
-        with col_p2:
+        with col_s2:
             st.markdown("**Person 2**")
-            spouse_age_now = st.number_input("Current Age", min_value=18.0, max_value=100.0, value=st.session_state.get('p2_age_now', defaults.spouse_age_now), step=1.0, key='p2_age_now', help="Current age (starting point of simulation)")
-            spouse_gross_income_month = st.number_input("Gross Income (₪K)", min_value=0.0, value=st.session_state.get('p2_income', defaults.spouse_gross_income_month / 1000), step=1.0, format="%.1f", key='p2_income', help="Monthly gross income before tax (Israeli tax calculated automatically)") * 1000
-
-            # Income schedule UI
             spouse_income_schedule = render_income_schedule_ui('p2', spouse_age_now, spouse_gross_income_month)
 
-            spouse_retire_age = st.number_input("Retirement Age",
-                                               min_value=18.0,
-                                               max_value=100.0,
-                                               value=st.session_state.get('p2_retire', defaults.spouse_retire_age),
-                                               step=1.0,
-                                               key='p2_retire',
-                                               help="Age to stop working (can be <= current age if already retired)")
-
-            spouse_pension_start_age = st.number_input("Pension Start Age", min_value=spouse_retire_age, max_value=100.0, value=st.session_state.get('p2_pension', defaults.spouse_pension_start_age), step=1.0, key='p2_pension', help="Age to start receiving pension income (usually 67 in Israel)")
-
-            spouse_pension_rate = 0.06  # Fixed rate (6% employee contribution)
-            spouse_pension_rate_employer = 0.125  # Fixed rate (12.5% employer contribution)
-            spouse_hishtalmut_rate_employee = 0.025  # Fixed rate (2.5% employee contribution)
-            spouse_hishtalmut_rate_employer = 0.075  # Fixed rate (7.5% employer contribution)
-            spouse_hishtalmut_salary_cap = defaults.spouse_hishtalmut_salary_cap
-
-            st.markdown("**Pension**")
-            spouse_pension_now = st.number_input("Pension Now (₪K)", min_value=0.0, value=st.session_state.get('p2_pension_now', defaults.spouse_pension_now / 1000), step=10.0, format="%.1f", key='p2_pension_now', help="Current balance in pension account (Keren Pensia)") * 1000
-            spouse_mekadem = st.number_input(
-                "Mekadem",
-                min_value=1.0,
-                value=st.session_state.get('p2_mekadem', defaults.spouse_mekadem),
-                step=1.0,
-                format="%.0f",
-                key='p2_mekadem',
-                help="Divisor for pension income (Monthly pension = Balance / Mekadem)"
-            )
-
-        # Create params from user inputs (old age pension values use defaults)
-        params = Params(
+        # Create params from user inputs (old age pension values use defaults).
+        # Built through the memoized build_params so unchanged inputs reuse
+        # the previous instance; schedule lists become tuples for hashing.
+        params_fields = dict(
             age_now=age_now,
             retire_age=retire_age,
             pension_start_age=pension_start_age,
@@ -526,16 +798,16 @@ def main():
             end_age=end_age,
             r_annual_real=r_annual_real,
             gross_income_month=gross_income_month,
-            pension_rate=pension_rate,
-            pension_rate_employer=pension_rate_employer,
-            hishtalmut_rate_employee=hishtalmut_rate_employee,
-            hishtalmut_rate_employer=hishtalmut_rate_employer,
+            pension_rate=PENSION_EMPLOYEE_RATE,
+            pension_rate_employer=PENSION_EMPLOYER_RATE,
+            hishtalmut_rate_employee=HISHTALMUT_EMPLOYEE_RATE,
+            hishtalmut_rate_employer=HISHTALMUT_EMPLOYER_RATE,
             hishtalmut_salary_cap=hishtalmut_salary_cap,
             spouse_gross_income_month=spouse_gross_income_month,
-            spouse_pension_rate=spouse_pension_rate,
-            spouse_pension_rate_employer=spouse_pension_rate_employer,
-            spouse_hishtalmut_rate_employee=spouse_hishtalmut_rate_employee,
-            spouse_hishtalmut_rate_employer=spouse_hishtalmut_rate_employer,
+            spouse_pension_rate=PENSION_EMPLOYEE_RATE,
+            spouse_pension_rate_employer=PENSION_EMPLOYER_RATE,
+            spouse_hishtalmut_rate_employee=HISHTALMUT_EMPLOYEE_RATE,
+            spouse_hishtalmut_rate_employer=HISHTALMUT_EMPLOYER_RATE,
             spouse_hishtalmut_salary_cap=spouse_hishtalmut_salary_cap,
             spend_month=spend_month,
             liquid_now=liquid_now,
@@ -549,6 +821,12 @@ def main():
             old_age_pension_month=defaults.old_age_pension_month,
             old_age_pension_start_age=defaults.old_age_pension_start_age
         )
+        for schedule_field in ('income_schedule', 'spouse_income_schedule',
+                               'one_time_events', 'expense_schedule'):
+            entries = params_fields[schedule_field]
+            if entries:
+                params_fields[schedule_field] = tuple(tuple(entry) for entry in entries)
+        params = build_params(tuple(sorted(params_fields.items())))
 
         # Display derived values
         st.divider()
@@ -556,13 +834,8 @@ def main():
         st.metric("Monthly Return Rate", f"{params.r_month * 100:.3f}%")
 
         # Calculate tax and net income for display
-        tax_p1 = calculate_monthly_tax_from_gross(params.gross_income_month)
-        net_p1 = params.gross_income_month - tax_p1
-        eff_rate_p1 = get_effective_tax_rate(params.gross_income_month)
-
-        tax_p2 = calculate_monthly_tax_from_gross(params.spouse_gross_income_month)
-        net_p2 = params.spouse_gross_income_month - tax_p2
-        eff_rate_p2 = get_effective_tax_rate(params.spouse_gross_income_month)
+        tax_p1, net_p1, eff_rate_p1, tax_p2, net_p2, eff_rate_p2 = derived_tax_metrics(
+            params.gross_income_month, params.spouse_gross_income_month)
 
         col_d1, col_d2 = st.columns(2)
         with col_d1:
@@ -596,44 +869,29 @@ def main():
         # Tax information expander
         with st.expander("ℹ️ Israeli Tax & Pension Information (2025)"):
             st.markdown("**Income Tax Brackets (Annual)**")
-            st.markdown("""
-            - ₪0 - ₪84,120: **10%**
-            - ₪84,120 - ₪120,720: **14%**
-            - ₪120,720 - ₪193,800: **20%**
-            - ₪193,800 - ₪269,280: **31%**
-            - ₪269,280 - ₪560,280: **35%**
-            - ₪560,280 - ₪721,560: **47%**
-            - Above ₪721,560: **50%**
-            """)
+            st.markdown(_TAX_BRACKETS_MD)
 
             st.markdown("**National Insurance + Health (Bituach Leumi + Briut) - Monthly**")
-            st.markdown("""
-            - Up to ₪7,522/month: **4.27%** (NI 1.04% + Health 3.23%)
-            - ₪7,522 - ₪50,695/month: **12.17%** (NI 7.00% + Health 5.17%)
-            - Cap at ₪50,695/month
-            """)
+            st.markdown(_NATIONAL_INSURANCE_MD)
 
             st.markdown("**Mandatory Pension Contributions**")
-            st.markdown("""
-            - **Employee contribution:** 6% of gross salary (deducted from paycheck)
-            - **Employer contribution:** 12.5% of gross salary (not deducted from paycheck)
-            - **Total pension accumulation:** 18.5% of gross salary
-
-            Note: This is mandatory by Israeli law. The simulation uses these rates by default.
-            """)
+            st.markdown(_PENSION_CONTRIBUTIONS_MD)
 
             st.markdown("**Net Income Calculation**")
-            st.markdown("""
-            Net to Hand = Gross - Income Tax - National Insurance - Employee Pension (6%)
-
-            Example for ₪30,000 gross:
-            - Income Tax: ~₪6,942/month
-            - National Insurance: ~₪3,020/month
-            - Employee Pension (6%): ₪1,800/month
-            - **Net to Hand: ~₪18,238/month**
-            - Employer adds ₪3,750/month to pension (12.5%)
-            - **Total Pension: ₪5,550/month (18.5%)**
-            """)
+            st.markdown(_NET_INCOME_MD)
+
+        # Persist only on explicit form submit; otherwise just refresh the
+        # snapshot the exit hook flushes, keeping disk I/O off the rerun path
+        global _last_config
+        _last_config = export_config_to_dict()
+        if params_submitted:
+            save_persisted_session()
+
+    # Params fields every plot call reads, bound once instead of re-fetching
+    # the attributes in each tab body
+    plot_context = (params.pension_start_age, params.spouse_pension_start_age,
+                    params.income_schedule, params.spouse_income_schedule,
+                    params.one_time_events, params.expense_schedule)
 
     # Main content
     tab1, tab2, tab3, tab4, tab5 = st.tabs(["Run Simulation", "Find Earliest Retirement", "Find Joint Retirement", "Compare Scenarios", "Max Monthly Expense"])
@@ -643,9 +901,9 @@ def main():
         st.markdown("Simulate your financial plan with the parameters specified in the sidebar.")
 
         if st.button("Run Simulation", type="primary"):
-            st.session_state['tab1_result'] = simulate(params.retire_age, params, params.spouse_retire_age)
+            ss['tab1_result'] = cached_simulate(params_to_key(params), params.retire_age, params.spouse_retire_age)
 
-        result = st.session_state.get('tab1_result')
+        result = ss.get('tab1_result')
         if result is not None:
             # Display summary
             if result.ok:
@@ -667,10 +925,8 @@ def main():
             # Plots
             if not result.df.empty:
                 st.plotly_chart(
-                    plot_combined(result.df, params.retire_age, params.spouse_retire_age,
-                                params.pension_start_age, params.spouse_pension_start_age,
-                                params.income_schedule, params.spouse_income_schedule,
-                                params.one_time_events, params.expense_schedule),
+                    cached_plot_combined(result.df, params.retire_age, params.spouse_retire_age,
+                                *plot_context),
                     width='stretch'
                 )
 
@@ -691,8 +947,8 @@ def main():
                         df_display = result.df
                         csv_suffix = "monthly"
 
-                    # Convert dataframe to CSV for download
-                    csv = df_display.to_csv(index=False)
+                    # Convert dataframe to CSV for download (cached per result)
+                    csv = df_to_csv(df_display)
                     st.download_button(
                         label="📥 Download as CSV",
                         data=csv,
@@ -700,7 +956,10 @@ def main():
                         mime="text/csv",
                         key="download_csv_tab1"
                     )
-                    st.dataframe(df_display, width='stretch')
+                    df_view = windowed_view(df_display)
+                    if len(df_view) < len(df_display):
+                        st.caption(f"Showing first and last 120 of {len(df_display)} rows - download the CSV for the full data.")
+                    st.dataframe(df_view, width='stretch', height=400)
 
     with tab2:
         st.header("Find Earliest Retirement Age (Person 1)")
@@ -717,7 +976,7 @@ def main():
 
         if st.button("Find Earliest Retirement", type="primary"):
             with st.spinner("Searching for earliest feasible retirement age for Person 1..."):
-                earliest_age, result = find_earliest_retirement(params, spouse_retire_age=search_spouse_retire)
+                earliest_age, result = cached_find_earliest_retirement(params_to_key(params), search_spouse_retire)
 
             if earliest_age is not None:
                 st.success(f"✅ Earliest feasible retirement age for Person 1: **{earliest_age:.1f}** years")
@@ -736,10 +995,8 @@ def main():
                 # Plots
                 if not result.df.empty:
                     st.plotly_chart(
-                        plot_combined(result.df, earliest_age, search_spouse_retire,
-                                    params.pension_start_age, params.spouse_pension_start_age,
-                                    params.income_schedule, params.spouse_income_schedule,
-                                    params.one_time_events, params.expense_schedule),
+                        cached_plot_combined(result.df, earliest_age, search_spouse_retire,
+                                    *plot_context),
                         width='stretch'
                     )
             else:
@@ -751,7 +1008,7 @@ def main():
 
         if st.button("Find Joint Retirement", type="primary"):
             with st.spinner("Searching for earliest joint retirement..."):
-                retire1, retire2, result = find_earliest_joint_retirement(params)
+                retire1, retire2, result = cached_find_earliest_joint_retirement(params_to_key(params))
 
             if retire1 is not None and retire2 is not None:
                 st.success(f"✅ Earliest joint retirement: Person 1 at **{retire1:.1f}**, Person 2 at **{retire2:.1f}** years")
@@ -770,10 +1027,8 @@ def main():
                 # Plots
                 if not result.df.empty:
                     st.plotly_chart(
-                        plot_combined(result.df, retire1, retire2,
-                                    params.pension_start_age, params.spouse_pension_start_age,
-                                    params.income_schedule, params.spouse_income_schedule,
-                                    params.one_time_events, params.expense_schedule),
+                        cached_plot_combined(result.df, retire1, retire2,
+                                    *plot_context),
                         width='stretch'
                     )
             else:
@@ -795,30 +1050,18 @@ def main():
             key='compare_spouse_retire'
         )
 
-        age_range = params.pension_start_age - params.age_now
-        retirement_ages = [params.age_now + (age_range * i / (num_scenarios - 1)) for i in range(num_scenarios)]
+        retirement_ages = np.linspace(params.age_now, params.pension_start_age, num_scenarios)
 
         if st.button("Compare Scenarios", type="primary"):
             with st.spinner("Running scenarios..."):
-                scenarios = compare_scenarios(params, retirement_ages, compare_spouse_retire)
+                scenarios = cached_compare_scenarios(params_to_key(params), tuple(retirement_ages), compare_spouse_retire)
 
             # Convert to DataFrame
             df_scenarios = pd.DataFrame(scenarios)
 
-            # Format for display
-            df_display = df_scenarios.copy()
-            df_display['retirement_age'] = df_display['retirement_age'].apply(lambda x: f"{x:.1f}")
-            df_display['spouse_retirement_age'] = df_display['spouse_retirement_age'].apply(lambda x: f"{x:.1f}")
-            df_display['feasible'] = df_display['feasible'].apply(lambda x: "✅" if x else "❌")
-            df_display['liquid_at_pension_start'] = df_display['liquid_at_pension_start'].apply(lambda x: f"₪{x / 1000:.1f}K")
-            df_display['pension_income_month'] = df_display['pension_income_month'].apply(lambda x: f"₪{x / 1000:.1f}K")
-            df_display['spouse_pension_income_month'] = df_display['spouse_pension_income_month'].apply(lambda x: f"₪{x / 1000:.1f}K")
-            df_display['liquid_end'] = df_display['liquid_end'].apply(lambda x: f"₪{x / 1000:.1f}K")
-            df_display['working_years'] = df_display['working_years'].apply(lambda x: f"{x:.1f}")
-            df_display['spouse_working_years'] = df_display['spouse_working_years'].apply(lambda x: f"{x:.1f}")
-
-            # Rename columns for display
-            df_display = df_display[[
+            # Select and rename columns, then defer per-cell formatting to a
+            # Styler instead of nine Python-level .apply loops
+            df_display = df_scenarios[[
                 'retirement_age',
                 'spouse_retirement_age',
                 'feasible',
@@ -842,7 +1085,23 @@ def main():
                 'Assets at End'
             ]
 
-            st.dataframe(df_display, width='stretch')
+            def _thousands(x):
+                return f"₪{x / 1000:.1f}K"
+
+            st.dataframe(
+                df_display.style.format({
+                    'P1 Retire Age': '{:.1f}',
+                    'P2 Retire Age': '{:.1f}',
+                    'Feasible': lambda x: "✅" if x else "❌",
+                    'P1 Working Yrs': '{:.1f}',
+                    'P2 Working Yrs': '{:.1f}',
+                    'Assets at Pension': _thousands,
+                    'P1 Pension/Mo': _thousands,
+                    'P2 Pension/Mo': _thousands,
+                    'Assets at End': _thousands,
+                }),
+                width='stretch'
+            )
 
             # Show earliest feasible
             feasible_scenarios = [s for s in scenarios if s['feasible']]
@@ -857,15 +1116,15 @@ def main():
 
         if st.button("Calculate Max Monthly Expense", type="primary"):
             with st.spinner("Calculating maximum monthly expense..."):
-                max_expense, result = find_max_monthly_expense(
-                    params,
+                max_expense, result = cached_find_max_monthly_expense(
+                    params_to_key(params),
                     params.min_assets,
-                    retire_age=params.retire_age,
-                    spouse_retire_age=params.spouse_retire_age
+                    params.retire_age,
+                    params.spouse_retire_age
                 )
-            st.session_state['tab5_result'] = (max_expense, result)
+            ss['tab5_result'] = (max_expense, result)
 
-        tab5_stored = st.session_state.get('tab5_result')
+        tab5_stored = ss.get('tab5_result')
         if tab5_stored is not None:
             max_expense, result = tab5_stored
             if max_expense is not None and result is not None:
@@ -897,10 +1156,8 @@ def main():
                 # Plots
                 if not result.df.empty:
                     st.plotly_chart(
-                        plot_combined(result.df, params.retire_age, params.spouse_retire_age,
-                                    params.pension_start_age, params.spouse_pension_start_age,
-                                    params.income_schedule, params.spouse_income_schedule,
-                                    params.one_time_events, params.expense_schedule),
+                        cached_plot_combined(result.df, params.retire_age, params.spouse_retire_age,
+                                    *plot_context),
                         width='stretch'
                     )
 
@@ -922,7 +1179,7 @@ def main():
                             csv_suffix = "monthly"
 
                         # Convert dataframe to CSV for download
-                        csv = df_display.to_csv(index=False)
+                        csv = df_to_csv(df_display)
                         st.download_button(
                             label="📥 Download as CSV",
                             data=csv,
@@ -930,7 +1187,10 @@ def main():
                             mime="text/csv",
                             key="download_csv_tab5"
                         )
-                        st.dataframe(df_display, width='stretch')
+                        df_view = windowed_view(df_display)
+                        if len(df_view) < len(df_display):
+                            st.caption(f"Showing first and last 120 of {len(df_display)} rows - download the CSV for the full data.")
+                        st.dataframe(df_view, width='stretch', height=400)
             else:
                 st.error("❌ Could not find a feasible solution. Try adjusting the Minimum Assets or retirement ages in the sidebar.")
 
@@ -3,15 +3,66 @@ Core data model and simulation logic for retirement planning.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Tuple
+import numpy as np
 import pandas as pd
 
-from retire_sim.israeli_tax import calculate_monthly_tax_from_gross
+from retire_sim.israeli_tax import (
+    ISRAELI_TAX_BRACKETS,
+    NATIONAL_INSURANCE,
+    calculate_monthly_tax_from_gross,
+    net_from_gross_vec,
+    tax_monthly_nb,
+)
+
+try:
+    # Numba is an optional accelerator: when installed, the monthly kernel is
+    # JIT-compiled (and cached on disk, so Streamlit reruns skip recompilation).
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba installed
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Tax bracket table flattened to plain arrays so the jitted kernel can compute
+# pension income tax without touching Python objects.
+_TAX_THRESHOLDS = np.array([b.threshold for b in ISRAELI_TAX_BRACKETS])
+_TAX_RATES = np.array([b.rate for b in ISRAELI_TAX_BRACKETS])
+_TAX_BASE = np.array([b.base_tax for b in ISRAELI_TAX_BRACKETS])
+
+
+def _schedule_as_arrays(schedule: Optional[list]) -> Optional[tuple]:
+    """Canonicalize an (age, value) schedule into sorted float64 array pairs.
+
+    Stable sort by age, so equal-age entries keep "last one wins" order.
+    Returns (ages, values) arrays, or None for a missing/empty schedule.
+    """
+    if not schedule:
+        return None
+    entries = sorted(schedule, key=lambda entry: entry[0])
+    schedule_ages = np.array([entry[0] for entry in entries], dtype=np.float64)
+    schedule_values = np.array([entry[1] for entry in entries], dtype=np.float64)
+    return schedule_ages, schedule_values
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Params:
-    """Parameters for retirement simulation (all in real terms, after inflation)."""
+    """Parameters for retirement simulation (all in real terms, after inflation).
+
+    Frozen with __slots__: instances are immutable (variants are built by
+    constructing a new Params), and the derived per-month values below are
+    precomputed once in __post_init__ instead of recomputed on every access.
+    """
 
     # Person 1 ages
     age_now: float = 38.0
@@ -104,64 +155,68 @@ class Params:
     # Pension tax exemption
     pension_tax_free_amount: float = 5000.0  # First ₪5,000 of pension income per person is tax-free
 
-    @property
-    def r_month(self) -> float:
-        """Monthly return rate derived from annual rate."""
-        return (1 + self.r_annual_real) ** (1/12) - 1
-
-    @property
-    def contrib_pension_month(self) -> float:
-        """Person 1 total pension contribution (employee 6% + employer 12.5% = 18.5%)."""
-        employee_contrib = self.gross_income_month * self.pension_rate
-        employer_contrib = self.gross_income_month * self.pension_rate_employer
-        return employee_contrib + employer_contrib
-
-    @property
-    def contrib_pension_employee_month(self) -> float:
-        """Person 1 employee pension contribution only (6%, deducted from salary)."""
-        return self.gross_income_month * self.pension_rate
-
-    @property
-    def contrib_hishtalmut_month(self) -> float:
-        """Person 1 total hishtalmut contribution (employee 2.5% + employer 7.5% = 10%)."""
-        # Calculate on capped salary (₪15,712/month for tax benefits in 2025)
-        capped_salary = min(self.gross_income_month, self.hishtalmut_salary_cap)
-        employee_contrib = capped_salary * self.hishtalmut_rate_employee
-        employer_contrib = capped_salary * self.hishtalmut_rate_employer
-        return employee_contrib + employer_contrib
-
-    @property
-    def contrib_hishtalmut_employee_month(self) -> float:
-        """Person 1 employee hishtalmut contribution only (2.5%, deducted from salary)."""
+    # Derived per-month values, precomputed in __post_init__
+    r_month: float = field(init=False, repr=False)  # Monthly return rate derived from annual rate
+    contrib_pension_month: float = field(init=False, repr=False)  # P1 total pension contribution (18.5%)
+    contrib_pension_employee_month: float = field(init=False, repr=False)  # P1 employee pension only (6%)
+    contrib_hishtalmut_month: float = field(init=False, repr=False)  # P1 total hishtalmut contribution (10%)
+    contrib_hishtalmut_employee_month: float = field(init=False, repr=False)  # P1 employee hishtalmut only (2.5%)
+    spouse_contrib_pension_month: float = field(init=False, repr=False)  # P2 total pension contribution (18.5%)
+    spouse_contrib_pension_employee_month: float = field(init=False, repr=False)  # P2 employee pension only (6%)
+    spouse_contrib_hishtalmut_month: float = field(init=False, repr=False)  # P2 total hishtalmut contribution (10%)
+    spouse_contrib_hishtalmut_employee_month: float = field(init=False, repr=False)  # P2 employee hishtalmut only (2.5%)
+    # Schedules canonicalized once into sorted (ages, values) array pairs,
+    # ready for np.searchsorted (None when the schedule is empty). compare
+    # is off: they are derived from the schedule fields above, and ndarrays
+    # would break the generated __eq__/__hash__
+    income_schedule_arrays: Optional[tuple] = field(init=False, repr=False, compare=False)
+    spouse_income_schedule_arrays: Optional[tuple] = field(init=False, repr=False, compare=False)
+    expense_schedule_arrays: Optional[tuple] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen dataclass: derived fields are assigned via object.__setattr__.
+        # Hishtalmut contributions are calculated on the capped salary
+        # (₪15,712/month for tax benefits in 2025).
+        set_attr = object.__setattr__
+
+        # Normalize schedules and events to nested tuples, so Params hashes
+        # (needed by the simulate cache in search.py) regardless of whether
+        # the caller handed in lists or tuples
+        for schedule_field in ('income_schedule', 'spouse_income_schedule',
+                               'one_time_events', 'expense_schedule'):
+            entries = getattr(self, schedule_field)
+            if entries is not None:
+                set_attr(self, schedule_field, tuple(tuple(entry) for entry in entries))
+
+        set_attr(self, 'r_month', (1 + self.r_annual_real) ** (1/12) - 1)
+
+        set_attr(self, 'contrib_pension_employee_month',
+                 self.gross_income_month * self.pension_rate)
+        set_attr(self, 'contrib_pension_month',
+                 self.contrib_pension_employee_month
+                 + self.gross_income_month * self.pension_rate_employer)
         capped_salary = min(self.gross_income_month, self.hishtalmut_salary_cap)
-        return capped_salary * self.hishtalmut_rate_employee
-
-    @property
-    def spouse_contrib_pension_month(self) -> float:
-        """Person 2 total pension contribution (employee 6% + employer 12.5% = 18.5%)."""
-        employee_contrib = self.spouse_gross_income_month * self.spouse_pension_rate
-        employer_contrib = self.spouse_gross_income_month * self.spouse_pension_rate_employer
-        return employee_contrib + employer_contrib
-
-    @property
-    def spouse_contrib_pension_employee_month(self) -> float:
-        """Person 2 employee pension contribution only (6%, deducted from salary)."""
-        return self.spouse_gross_income_month * self.spouse_pension_rate
-
-    @property
-    def spouse_contrib_hishtalmut_month(self) -> float:
-        """Person 2 total hishtalmut contribution (employee 2.5% + employer 7.5% = 10%)."""
-        # Calculate on capped salary (₪15,712/month for tax benefits in 2025)
-        capped_salary = min(self.spouse_gross_income_month, self.spouse_hishtalmut_salary_cap)
-        employee_contrib = capped_salary * self.spouse_hishtalmut_rate_employee
-        employer_contrib = capped_salary * self.spouse_hishtalmut_rate_employer
-        return employee_contrib + employer_contrib
-
-    @property
-    def spouse_contrib_hishtalmut_employee_month(self) -> float:
-        """Person 2 employee hishtalmut contribution only (2.5%, deducted from salary)."""
-        capped_salary = min(self.spouse_gross_income_month, self.spouse_hishtalmut_salary_cap)
-        return capped_salary * self.spouse_hishtalmut_rate_employee
+        set_attr(self, 'contrib_hishtalmut_employee_month',
+                 capped_salary * self.hishtalmut_rate_employee)
+        set_attr(self, 'contrib_hishtalmut_month',
+                 self.contrib_hishtalmut_employee_month
+                 + capped_salary * self.hishtalmut_rate_employer)
+
+        set_attr(self, 'spouse_contrib_pension_employee_month',
+                 self.spouse_gross_income_month * self.spouse_pension_rate)
+        set_attr(self, 'spouse_contrib_pension_month',
+                 self.spouse_contrib_pension_employee_month
+                 + self.spouse_gross_income_month * self.spouse_pension_rate_employer)
+        spouse_capped_salary = min(self.spouse_gross_income_month, self.spouse_hishtalmut_salary_cap)
+        set_attr(self, 'spouse_contrib_hishtalmut_employee_month',
+                 spouse_capped_salary * self.spouse_hishtalmut_rate_employee)
+        set_attr(self, 'spouse_contrib_hishtalmut_month',
+                 self.spouse_contrib_hishtalmut_employee_month
+                 + spouse_capped_salary * self.spouse_hishtalmut_rate_employer)
+
+        set_attr(self, 'income_schedule_arrays', _schedule_as_arrays(self.income_schedule))
+        set_attr(self, 'spouse_income_schedule_arrays', _schedule_as_arrays(self.spouse_income_schedule))
+        set_attr(self, 'expense_schedule_arrays', _schedule_as_arrays(self.expense_schedule))
 
 
 @dataclass
@@ -170,7 +225,11 @@ class Result:
 
     ok: bool
     reason: str
-    df: pd.DataFrame
+
+    # Per-month column arrays (None for validation failures); the DataFrame
+    # view is materialized lazily so feasibility-only callers that just read
+    # the summary scalars never pay for its construction
+    columns: Optional[dict] = field(default=None, repr=False)
 
     # Summary metrics for Person 1
     pension_at_start: float = 0.0
@@ -184,48 +243,308 @@ class Result:
     liquid_end: float = 0.0
     liquid_at_pension_start: float = 0.0  # When first person's pension starts
 
+    _df: Optional[pd.DataFrame] = field(default=None, repr=False, compare=False)
 
-def get_income_at_age(age: float, base_income: float, income_schedule: Optional[list]) -> float:
-    """Get the gross income at a specific age based on the income schedule.
+    @property
+    def df(self) -> pd.DataFrame:
+        """Per-month trajectory as a DataFrame, built on first access."""
+        if self._df is None:
+            self._df = pd.DataFrame(self.columns) if self.columns is not None else pd.DataFrame()
+        return self._df
 
-    Args:
-        age: Current age (in years, e.g., 42.5 for 42 years 6 months)
-        base_income: Base gross income (used if no schedule or before first change)
-        income_schedule: Optional list of (age, gross_income) tuples
-            where age is in years (same units as age parameter)
 
-    Returns:
-        Gross income at the specified age
+def _piecewise_from_schedule(ages: np.ndarray, base_value: float,
+                             schedule_arrays: Optional[tuple]) -> np.ndarray:
+    """Expand a canonicalized schedule into a per-month value array.
+
+    Takes the presorted (ages, values) pair built by _schedule_as_arrays in
+    Params.__post_init__. Uses np.searchsorted over the schedule ages: each
+    month gets the value of the most recent schedule entry at or before that
+    age, or base_value before the first entry.
     """
-    if not income_schedule:
-        return base_income
+    values = np.full(len(ages), base_value, dtype=np.float64)
+    if schedule_arrays is not None:
+        schedule_ages, schedule_values = schedule_arrays
+        idx = np.searchsorted(schedule_ages, ages, side='right')
+        has_change = idx > 0
+        values[has_change] = schedule_values[idx[has_change] - 1]
+    return values
+
+
+def _first_month_reaching(ages: np.ndarray, target_age: float) -> int:
+    """Index of the first month at or past target_age (len(ages) if never reached)."""
+    hit = np.flatnonzero(ages >= target_age)
+    return int(hit[0]) if hit.size else len(ages)
+
+
+@njit(cache=True, fastmath=True)
+def _simulate_core(r_month,
+                   liquid_nontaxable0, liquid_taxable0,
+                   pension1_0, pension2_0,
+                   mekadem1, mekadem2,
+                   pension_start_month1, pension_start_month2,
+                   old_age_start_month1, old_age_start_month2,
+                   old_age_pension_month, pension_tax_free_amount,
+                   liquid_withdrawal_tax_rate, min_assets,
+                   salary1_net, salary2_net,
+                   hishtalmut1, hishtalmut2,
+                   pension_contrib1, pension_contrib2,
+                   one_time_event, expense,
+                   tax_thresholds, tax_rates, tax_base,
+                   ni_rate_low, ni_rate_high, ni_threshold_low, ni_cap,
+                   stop_on_violation):
+    """Pure-numeric month-by-month kernel of simulate().
+
+    Only takes floats, ints and float64 arrays, so it is fully jittable.
+    Salary-side flows (net income, hishtalmut, pension contributions) are
+    precomputed per month by the caller; pension income tax must be computed
+    here because the pension annuity depends on the accumulated balance.
+
+    With stop_on_violation the loop exits at the first month liquid drops
+    below min_assets - the verdict is already final there, and the months
+    not reached stay unwritten. Only for callers that never read the trace
+    (the feasibility batch).
+
+    Returns per-month arrays plus the scalar summary values.
+    """
+    n = len(expense)
+
+    liquid_arr = np.empty(n)
+    pension1_arr = np.empty(n)
+    pension2_arr = np.empty(n)
+    pension1_income_arr = np.zeros(n)
+    pension2_income_arr = np.zeros(n)
+    pension1_income_net_arr = np.zeros(n)
+    pension2_income_net_arr = np.zeros(n)
+    total_pension_income_arr = np.zeros(n)
+    old_age_pension_arr = np.zeros(n)
+    withdrawal_tax_arr = np.zeros(n)
+    liquid_change_arr = np.zeros(n)
+
+    liquid_nontaxable = liquid_nontaxable0
+    liquid_taxable = liquid_taxable0
+    pension1 = pension1_0
+    pension2 = pension2_0
 
-    # Find applicable income changes (at or before current age)
-    # Note: Both age and schedule ages must be in the same units (years)
-    applicable_changes = [(sch_age, income) for sch_age, income in income_schedule if sch_age <= age]
-    # Return most recent change, or base income if no changes yet
-    return applicable_changes[-1][1] if applicable_changes else base_income
+    pension1_income_active = False
+    pension1_income_month = 0.0
+    pension2_income_active = False
+    pension2_income_month = 0.0
 
+    liquid_at_first_pension_start = 0.0
+    first_pension_started = False
+    min_assets_violation_month = -1
 
-def get_expense_at_age(age: float, base_expense: float, expense_schedule: Optional[list]) -> float:
-    """Get the monthly expense at a specific age based on the expense schedule.
+    # Hoisted monthly growth factor; stays in a register across the loop
+    growth = 1.0 + r_month
 
-    Args:
-        age: Current age (in years, e.g., 42.5 for 42 years 6 months)
-        base_expense: Base monthly expense (used if no schedule or before first change)
-        expense_schedule: Optional list of (age, monthly_expense) tuples
-            where age is in years (same units as age parameter)
+    for month in range(n):
+        # Apply returns to all accounts (including both liquid portions)
+        liquid_nontaxable *= growth
+        liquid_taxable *= growth
+        liquid = liquid_nontaxable + liquid_taxable
+        pension1 *= growth
+        pension2 *= growth
 
-    Returns:
-        Monthly expense at the specified age
-    """
-    if not expense_schedule:
-        return base_expense
+        # Salary flows (precomputed): hishtalmut goes to nontaxable liquid,
+        # pension contributions accumulate in the pension accounts
+        net_income_this_month = salary1_net[month] + salary2_net[month]
+        liquid_nontaxable += hishtalmut1[month]
+        pension1 += pension_contrib1[month]
+        liquid_nontaxable += hishtalmut2[month]
+        pension2 += pension_contrib2[month]
+
+        # Add net income to nontaxable liquid (income already taxed)
+        liquid_nontaxable += net_income_this_month
+
+        # One-time events go to nontaxable (assume already post-tax)
+        liquid_nontaxable += one_time_event[month]
+
+        # Activate pension income when each person reaches pension start age
+        if not pension1_income_active and month >= pension_start_month1:
+            pension1_income_active = True
+            pension1_income_month = pension1 / mekadem1
+            if not first_pension_started:
+                liquid_at_first_pension_start = liquid
+                first_pension_started = True
 
-    # Find applicable expense changes (at or before current age)
-    applicable_changes = [(sch_age, expense) for sch_age, expense in expense_schedule if sch_age <= age]
-    # Return most recent change, or base expense if no changes yet
-    return applicable_changes[-1][1] if applicable_changes else base_expense
+        if not pension2_income_active and month >= pension_start_month2:
+            pension2_income_active = True
+            pension2_income_month = pension2 / mekadem2
+            if not first_pension_started:
+                liquid_at_first_pension_start = liquid
+                first_pension_started = True
+
+        # Old age pension (קצבת זקנה) amounts (needed for tax calculation)
+        old_age_pension1_amount = old_age_pension_month if month >= old_age_start_month1 else 0.0
+        old_age_pension2_amount = old_age_pension_month if month >= old_age_start_month2 else 0.0
+        total_old_age_pension = old_age_pension1_amount + old_age_pension2_amount
+
+        # Total pension income this month (after tax)
+        # Tax is applied to pension income, with first ₪5K per person tax-free
+        total_pension_income_net = 0.0
+        pension_net_p1 = 0.0
+        pension_net_p2 = 0.0
+        if pension1_income_active:
+            pension_gross_p1 = pension1_income_month
+            taxable_pension_p1 = max(0.0, pension_gross_p1 - pension_tax_free_amount)
+            pension_tax_p1 = tax_monthly_nb(
+                taxable_pension_p1, tax_thresholds, tax_rates, tax_base,
+                ni_rate_low, ni_rate_high, ni_threshold_low, ni_cap)
+            pension_net_p1 = pension_gross_p1 - pension_tax_p1
+            total_pension_income_net += pension_net_p1
+            pension1 -= pension_gross_p1
+        if pension2_income_active:
+            pension_gross_p2 = pension2_income_month
+            taxable_pension_p2 = max(0.0, pension_gross_p2 - pension_tax_free_amount)
+            pension_tax_p2 = tax_monthly_nb(
+                taxable_pension_p2, tax_thresholds, tax_rates, tax_base,
+                ni_rate_low, ni_rate_high, ni_threshold_low, ni_cap)
+            pension_net_p2 = pension_gross_p2 - pension_tax_p2
+            total_pension_income_net += pension_net_p2
+            pension2 -= pension_gross_p2
+
+        # Pension and old age pension income are net, already taxed
+        liquid_nontaxable += total_pension_income_net
+        liquid_nontaxable += total_old_age_pension
+
+        current_monthly_expense = expense[month]
+
+        # Total income to liquid (before deducting expenses)
+        total_income_to_liquid = (net_income_this_month + total_pension_income_net +
+                                  total_old_age_pension + hishtalmut1[month] + hishtalmut2[month] +
+                                  one_time_event[month])
+
+        # Shortfall occurs when expenses exceed all income sources
+        shortfall = current_monthly_expense - total_income_to_liquid
+        liquid_withdrawal_tax = 0.0
+
+        # Always deduct expenses from liquid
+        # First, deduct from nontaxable (where income was added)
+        liquid_nontaxable -= current_monthly_expense
+
+        # If expenses exceeded income (shortfall > 0), we withdrew from existing
+        # assets - apply withdrawal tax on the taxable portion of the excess
+        if shortfall > 0:
+            # Total liquid and taxable percentage BEFORE the expense deduction
+            total_liquid_before = liquid_nontaxable + current_monthly_expense + liquid_taxable
+
+            if total_liquid_before > 0:
+                taxable_pct = liquid_taxable / total_liquid_before
+            else:
+                taxable_pct = 0.0
+
+            taxable_portion_of_shortfall = shortfall * taxable_pct
+            liquid_withdrawal_tax = taxable_portion_of_shortfall * liquid_withdrawal_tax_rate
+
+            # Deduct the withdrawal tax proportionally from both buckets
+            total_liquid_now = liquid_nontaxable + liquid_taxable
+            if total_liquid_now > 0:
+                liquid_nontaxable -= liquid_withdrawal_tax * (liquid_nontaxable / total_liquid_now)
+                liquid_taxable -= liquid_withdrawal_tax * (liquid_taxable / total_liquid_now)
+
+        # Recalculate total liquid
+        liquid = liquid_nontaxable + liquid_taxable
+
+        # Track if liquid went below minimum assets (but continue simulation)
+        if min_assets_violation_month < 0 and liquid < min_assets:
+            min_assets_violation_month = month
+            if stop_on_violation:
+                break
+
+        liquid_arr[month] = liquid
+        pension1_arr[month] = pension1
+        pension2_arr[month] = pension2
+        if pension1_income_active:
+            pension1_income_arr[month] = pension1_income_month
+            pension1_income_net_arr[month] = pension_net_p1
+        if pension2_income_active:
+            pension2_income_arr[month] = pension2_income_month
+            pension2_income_net_arr[month] = pension_net_p2
+        total_pension_income_arr[month] = total_pension_income_net
+        old_age_pension_arr[month] = total_old_age_pension
+        withdrawal_tax_arr[month] = liquid_withdrawal_tax
+        # Net change to liquid from cash flows (excluding investment returns)
+        liquid_change_arr[month] = total_income_to_liquid - current_monthly_expense - liquid_withdrawal_tax
+
+    return (liquid_arr, pension1_arr, pension2_arr,
+            pension1_income_arr, pension2_income_arr,
+            pension1_income_net_arr, pension2_income_net_arr,
+            total_pension_income_arr, old_age_pension_arr,
+            withdrawal_tax_arr, liquid_change_arr,
+            pension1_income_month, pension2_income_month,
+            liquid_at_first_pension_start, min_assets_violation_month)
+
+
+@njit(parallel=True, cache=True)
+def _simulate_core_batch(r_month,
+                         liquid_nontaxable0, liquid_taxable0,
+                         pension1_0, pension2_0,
+                         mekadem1, mekadem2,
+                         pension_start_month1, pension_start_month2,
+                         old_age_start_month1, old_age_start_month2,
+                         old_age_pension_month, pension_tax_free_amount,
+                         liquid_withdrawal_tax_rate, min_assets,
+                         salary1_net, salary2_net,
+                         hishtalmut1, hishtalmut2,
+                         pension_contrib1, pension_contrib2,
+                         one_time_event, expense,
+                         tax_thresholds, tax_rates, tax_base,
+                         ni_rate_low, ni_rate_high, ni_threshold_low, ni_cap):
+    """Run _simulate_core once per scenario row of the 2D flow arrays.
+
+    The scenarios share everything except the salary-side flows and the
+    expense series (shape [n_scenarios, n_months]); events and the scalar
+    parameters are common. Only the feasibility-relevant outputs are
+    collected: the final liquid balance and the first min-assets violation
+    month (-1 if none).
+
+    Scenarios are independent, so the outer loop is a prange: numba fans the
+    rows out across cores, each iteration keeping its state in registers and
+    writing only its own output slots.
+    """
+    n_scenarios = salary1_net.shape[0]
+    n_months = salary1_net.shape[1]
+    liquid_end = np.empty(n_scenarios)
+    violation_month = np.empty(n_scenarios, np.int64)
+    for s in prange(n_scenarios):
+        res = _simulate_core(
+            r_month,
+            liquid_nontaxable0, liquid_taxable0,
+            pension1_0, pension2_0,
+            mekadem1, mekadem2,
+            pension_start_month1, pension_start_month2,
+            old_age_start_month1, old_age_start_month2,
+            old_age_pension_month, pension_tax_free_amount,
+            liquid_withdrawal_tax_rate, min_assets,
+            salary1_net[s], salary2_net[s],
+            hishtalmut1[s], hishtalmut2[s],
+            pension_contrib1[s], pension_contrib2[s],
+            one_time_event, expense[s],
+            tax_thresholds, tax_rates, tax_base,
+            ni_rate_low, ni_rate_high, ni_threshold_low, ni_cap,
+            True)
+        liquid_end[s] = res[0][n_months - 1]
+        violation_month[s] = res[14]
+    return liquid_end, violation_month
+
+
+if NUMBA_AVAILABLE:
+    # Warm the kernel at import: triggers compilation (or the on-disk cache
+    # load, with cache=True above) on a 1-month dummy run so the first
+    # user-facing simulate() call pays no JIT latency.
+    _warmup_zeros = np.zeros(1)
+    _simulate_core(
+        0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1, 1, 1, 1,
+        0.0, 0.0, 0.0, 0.0,
+        _warmup_zeros, _warmup_zeros, _warmup_zeros, _warmup_zeros,
+        _warmup_zeros, _warmup_zeros, _warmup_zeros, _warmup_zeros,
+        _TAX_THRESHOLDS, _TAX_RATES, _TAX_BASE,
+        NATIONAL_INSURANCE.rate_low, NATIONAL_INSURANCE.rate_high,
+        NATIONAL_INSURANCE.threshold_low_monthly, NATIONAL_INSURANCE.cap_monthly,
+        False
+    )
+    del _warmup_zeros
 
 
 def simulate(retire_age: float, params: Params, spouse_retire_age: Optional[float] = None) -> Result:
@@ -234,6 +553,12 @@ def simulate(retire_age: float, params: Params, spouse_retire_age: Optional[floa
 
     Uses end-of-month convention for all cashflows and balance updates.
 
+    Structure: everything without cross-month coupling (ages, working masks,
+    schedule expansion, salary taxes, contributions, one-time events) is
+    precomputed as length-total_months arrays; only the sequential balance
+    recursion runs month by month, inside the jitted _simulate_core kernel.
+    The DataFrame is assembled once from the column arrays at the end.
+
     Args:
         retire_age: Age at which person 1 retires
         params: Simulation parameters
@@ -251,15 +576,13 @@ def simulate(retire_age: float, params: Params, spouse_retire_age: Optional[floa
     if retire_age > params.pension_start_age:
         return Result(
             ok=False,
-            reason="Person 1 retirement age cannot be after pension start age",
-            df=pd.DataFrame()
+            reason="Person 1 retirement age cannot be after pension start age"
         )
 
     if spouse_retire_age > params.spouse_pension_start_age:
         return Result(
             ok=False,
-            reason="Person 2 retirement age cannot be after pension start age",
-            df=pd.DataFrame()
+            reason="Person 2 retirement age cannot be after pension start age"
         )
 
     # Validate income schedule for Person 1
@@ -268,20 +591,17 @@ def simulate(retire_age: float, params: Params, spouse_retire_age: Optional[floa
             if schedule_age < params.age_now:
                 return Result(
                     ok=False,
-                    reason=f"Person 1 income schedule age {schedule_age} cannot be before current age {params.age_now}",
-                    df=pd.DataFrame()
+                    reason=f"Person 1 income schedule age {schedule_age} cannot be before current age {params.age_now}"
                 )
             if schedule_age >= retire_age:
                 return Result(
                     ok=False,
-                    reason=f"Person 1 income schedule age {schedule_age} cannot be at or after retirement age {retire_age}",
-                    df=pd.DataFrame()
+                    reason=f"Person 1 income schedule age {schedule_age} cannot be at or after retirement age {retire_age}"
                 )
             if schedule_income < 0:
                 return Result(
                     ok=False,
-                    reason=f"Person 1 income schedule income {schedule_income} cannot be negative",
-                    df=pd.DataFrame()
+                    reason=f"Person 1 income schedule income {schedule_income} cannot be negative"
                 )
 
     # Validate income schedule for Person 2
@@ -290,20 +610,17 @@ def simulate(retire_age: float, params: Params, spouse_retire_age: Optional[floa
             if schedule_age < params.spouse_age_now:
                 return Result(
                     ok=False,
-                    reason=f"Person 2 income schedule age {schedule_age} cannot be before current age {params.spouse_age_now}",
-                    df=pd.DataFrame()
+                    reason=f"Person 2 income schedule age {schedule_age} cannot be before current age {params.spouse_age_now}"
                 )
             if schedule_age >= spouse_retire_age:
                 return Result(
                     ok=False,
-                    reason=f"Person 2 income schedule age {schedule_age} cannot be at or after retirement age {spouse_retire_age}",
-                    df=pd.DataFrame()
+                    reason=f"Person 2 income schedule age {schedule_age} cannot be at or after retirement age {spouse_retire_age}"
                 )
             if schedule_income < 0:
                 return Result(
                     ok=False,
-                    reason=f"Person 2 income schedule income {schedule_income} cannot be negative",
-                    df=pd.DataFrame()
+                    reason=f"Person 2 income schedule income {schedule_income} cannot be negative"
                 )
 
     # Validate one-time events
@@ -312,14 +629,12 @@ def simulate(retire_age: float, params: Params, spouse_retire_age: Optional[floa
             if event_age < params.age_now:
                 return Result(
                     ok=False,
-                    reason=f"One-time event at age {event_age} cannot be before current age {params.age_now}",
-                    df=pd.DataFrame()
+                    reason=f"One-time event at age {event_age} cannot be before current age {params.age_now}"
                 )
             if event_age > params.end_age:
                 return Result(
                     ok=False,
-                    reason=f"One-time event at age {event_age} cannot be after end age {params.end_age}",
-                    df=pd.DataFrame()
+                    reason=f"One-time event at age {event_age} cannot be after end age {params.end_age}"
                 )
 
     # Validate expense schedule
@@ -328,332 +643,189 @@ def simulate(retire_age: float, params: Params, spouse_retire_age: Optional[floa
             if schedule_age < params.age_now:
                 return Result(
                     ok=False,
-                    reason=f"Expense schedule age {schedule_age} cannot be before current age {params.age_now}",
-                    df=pd.DataFrame()
+                    reason=f"Expense schedule age {schedule_age} cannot be before current age {params.age_now}"
                 )
             if schedule_age > params.end_age:
                 return Result(
                     ok=False,
-                    reason=f"Expense schedule age {schedule_age} cannot be after end age {params.end_age}",
-                    df=pd.DataFrame()
+                    reason=f"Expense schedule age {schedule_age} cannot be after end age {params.end_age}"
                 )
             if schedule_expense < 0:
                 return Result(
                     ok=False,
-                    reason=f"Expense schedule expense {schedule_expense} cannot be negative",
-                    df=pd.DataFrame()
+                    reason=f"Expense schedule expense {schedule_expense} cannot be negative"
                 )
 
     # Determine simulation duration (until older person reaches end_age)
     older_age_now = max(params.age_now, params.spouse_age_now)
-    total_months = round((params.end_age - older_age_now) * 12)
+    total_months = max(0, round((params.end_age - older_age_now) * 12))
+
+    months = np.arange(total_months)
+    ages1 = params.age_now + months / 12
+    ages2 = params.spouse_age_now + months / 12
+
+    working1 = ages1 < retire_age
+    working2 = ages2 < spouse_retire_age
+
+    # Gross income per month from the schedules, zeroed after each retirement.
+    # All downstream salary flows vanish with a zero gross (tax of 0 is 0),
+    # so the working mask only needs to be applied here.
+    gross1 = np.where(working1, _piecewise_from_schedule(ages1, params.gross_income_month, params.income_schedule_arrays), 0.0)
+    gross2 = np.where(working2, _piecewise_from_schedule(ages2, params.spouse_gross_income_month, params.spouse_income_schedule_arrays), 0.0)
+
+    # Net of income tax and NI per month (single fused bracket lookup over
+    # the whole series; the tax itself is never needed separately here)
+    after_tax1 = net_from_gross_vec(gross1)
+    after_tax2 = net_from_gross_vec(gross2)
+
+    # Employee pension: 6% of current gross
+    employee_pension1 = gross1 * params.pension_rate
+    employee_pension2 = gross2 * params.spouse_pension_rate
+
+    # Employee hishtalmut: 2.5% of capped salary
+    capped_salary1 = np.minimum(gross1, params.hishtalmut_salary_cap)
+    employee_hishtalmut1 = capped_salary1 * params.hishtalmut_rate_employee
+    capped_salary2 = np.minimum(gross2, params.spouse_hishtalmut_salary_cap)
+    employee_hishtalmut2 = capped_salary2 * params.spouse_hishtalmut_rate_employee
+
+    salary1_gross = gross1
+    salary2_gross = gross2
+    # Net income after tax, employee pension, and employee hishtalmut deduction
+    salary1_net = after_tax1 - employee_pension1 - employee_hishtalmut1
+    salary2_net = after_tax2 - employee_pension2 - employee_hishtalmut2
+    # Total hishtalmut (employee 2.5% + employer 7.5% = 10%) on capped salary
+    hishtalmut1 = employee_hishtalmut1 + capped_salary1 * params.hishtalmut_rate_employer
+    hishtalmut2 = employee_hishtalmut2 + capped_salary2 * params.spouse_hishtalmut_rate_employer
+    # Total pension (employee 6% + employer 12.5% = 18.5%)
+    pension_contrib1 = employee_pension1 + gross1 * params.pension_rate_employer
+    pension_contrib2 = employee_pension2 + gross2 * params.spouse_pension_rate_employer
+
+    # Monthly expense at each age (may change based on expense schedule)
+    expense = _piecewise_from_schedule(ages1, params.spend_month, params.expense_schedule_arrays)
+
+    # One-time events, bucketed into the month where Person 1 reaches the event age
+    one_time_event = np.zeros(total_months)
+    if params.one_time_events:
+        for event_age, amount, description in params.one_time_events:
+            event_month = _first_month_reaching(ages1, event_age)
+            if event_month < total_months:
+                one_time_event[event_month] += amount
+
+    # Month indices where pension income / old age pension activate
+    pension_start_month1 = _first_month_reaching(ages1, params.pension_start_age)
+    pension_start_month2 = _first_month_reaching(ages2, params.spouse_pension_start_age)
+    old_age_start_month1 = _first_month_reaching(ages1, params.old_age_pension_start_age)
+    old_age_start_month2 = _first_month_reaching(ages2, params.old_age_pension_start_age)
 
-    # Initialize tracking
     # Split liquid into taxable and non-taxable portions
     liquid_nontaxable = params.liquid_now * params.liquid_nontaxable_pct
     liquid_taxable = params.liquid_now * (1.0 - params.liquid_nontaxable_pct)
-    liquid = liquid_nontaxable + liquid_taxable  # Total liquid for tracking
-
-    pension1 = params.pension_now
-    pension2 = params.spouse_pension_now
-    r_month = params.r_month
-
-    # Track pension income (starts when each person reaches their pension start age)
-    pension1_income_active = False
-    pension1_income_month = 0.0
-    pension2_income_active = False
-    pension2_income_month = 0.0
-
-    # Track old age pension (קצבת זקנה) from National Insurance
-    old_age_pension1_active = False
-    old_age_pension2_active = False
-
-    liquid_at_first_pension_start = 0.0
-    first_pension_started = False
 
-    # Track minimum assets violation
-    min_assets_violated = False
-    min_assets_violation_reason = ""
-
-    # Track which one-time events have been applied
-    applied_events = set()
-
-    records = []
-
-    # Simulate month by month
-    for month in range(total_months):
-        age1 = params.age_now + month / 12
-        age2 = params.spouse_age_now + month / 12
-
-        # Apply returns to all accounts (including both liquid portions)
-        liquid_nontaxable *= (1 + r_month)
-        liquid_taxable *= (1 + r_month)
-        liquid = liquid_nontaxable + liquid_taxable
-        pension1 *= (1 + r_month)
-        pension2 *= (1 + r_month)
-
-        # Determine income and contributions for each person
-        net_income_this_month = 0.0
-
-        # Initialize salary and hishtalmut tracking variables
-        salary1_gross = 0.0
-        salary1_net = 0.0
-        hishtalmut1 = 0.0
-        salary2_gross = 0.0
-        salary2_net = 0.0
-        hishtalmut2 = 0.0
-
-        # Person 1 working?
-        person1_working = age1 < retire_age
-        if person1_working:
-            # Get current gross income based on income schedule
-            gross_p1 = get_income_at_age(age1, params.gross_income_month, params.income_schedule)
-
-            # Calculate contributions based on current gross income
-            tax_p1 = calculate_monthly_tax_from_gross(gross_p1)
-
-            # Employee pension: 6% of current gross
-            employee_pension_p1 = gross_p1 * params.pension_rate
-
-            # Employee hishtalmut: 2.5% of capped salary
-            capped_salary_p1 = min(gross_p1, params.hishtalmut_salary_cap)
-            employee_hishtalmut_p1 = capped_salary_p1 * params.hishtalmut_rate_employee
-
-            # Net income after tax, employee pension, and employee hishtalmut deduction
-            net_p1 = gross_p1 - tax_p1 - employee_pension_p1 - employee_hishtalmut_p1
-            net_income_this_month += net_p1
-
-            # Track salary income
-            salary1_gross = gross_p1
-            salary1_net = net_p1
-
-            # Total hishtalmut (employee 2.5% + employer 7.5% = 10%) on capped salary
-            employer_hishtalmut_p1 = capped_salary_p1 * params.hishtalmut_rate_employer
-            hishtalmut1 = employee_hishtalmut_p1 + employer_hishtalmut_p1
-            # Hishtalmut goes to nontaxable (already taxed)
-            liquid_nontaxable += hishtalmut1
-
-            # Total pension (employee 6% + employer 12.5% = 18.5%)
-            employer_pension_p1 = gross_p1 * params.pension_rate_employer
-            pension1 += employee_pension_p1 + employer_pension_p1
-
-        # Person 2 working?
-        person2_working = age2 < spouse_retire_age
-        if person2_working:
-            # Get current gross income based on income schedule
-            gross_p2 = get_income_at_age(age2, params.spouse_gross_income_month, params.spouse_income_schedule)
-
-            # Calculate contributions based on current gross income
-            tax_p2 = calculate_monthly_tax_from_gross(gross_p2)
-
-            # Employee pension: 6% of current gross
-            employee_pension_p2 = gross_p2 * params.spouse_pension_rate
-
-            # Employee hishtalmut: 2.5% of capped salary
-            capped_salary_p2 = min(gross_p2, params.spouse_hishtalmut_salary_cap)
-            employee_hishtalmut_p2 = capped_salary_p2 * params.spouse_hishtalmut_rate_employee
-
-            # Net income after tax, employee pension, and employee hishtalmut deduction
-            net_p2 = gross_p2 - tax_p2 - employee_pension_p2 - employee_hishtalmut_p2
-            net_income_this_month += net_p2
-
-            # Track salary income
-            salary2_gross = gross_p2
-            salary2_net = net_p2
-
-            # Total hishtalmut (employee 2.5% + employer 7.5% = 10%) on capped salary
-            employer_hishtalmut_p2 = capped_salary_p2 * params.spouse_hishtalmut_rate_employer
-            hishtalmut2 = employee_hishtalmut_p2 + employer_hishtalmut_p2
-            # Hishtalmut goes to nontaxable (already taxed)
-            liquid_nontaxable += hishtalmut2
-
-            # Total pension (employee 6% + employer 12.5% = 18.5%)
-            employer_pension_p2 = gross_p2 * params.spouse_pension_rate_employer
-            pension2 += employee_pension_p2 + employer_pension_p2
-
-        # Add net income to nontaxable liquid (income already taxed)
-        liquid_nontaxable += net_income_this_month
-
-        # Apply one-time events (if any) at the appropriate age
-        one_time_event_amount = 0.0
-        if params.one_time_events:
-            for idx, (event_age, amount, description) in enumerate(params.one_time_events):
-                # Apply event once when Person 1 reaches the specified age
-                if age1 >= event_age and idx not in applied_events:
-                    # One-time events go to nontaxable (assume already post-tax)
-                    liquid_nontaxable += amount
-                    one_time_event_amount += amount
-                    applied_events.add(idx)
-
-        # Activate pension income when each person reaches pension start age
-        if not pension1_income_active and age1 >= params.pension_start_age:
-            pension1_income_active = True
-            pension1_income_month = pension1 / params.mekadem
-            if not first_pension_started:
-                liquid_at_first_pension_start = liquid
-                first_pension_started = True
-
-        if not pension2_income_active and age2 >= params.spouse_pension_start_age:
-            pension2_income_active = True
-            pension2_income_month = pension2 / params.spouse_mekadem
-            if not first_pension_started:
-                liquid_at_first_pension_start = liquid
-                first_pension_started = True
-
-        # Activate old age pension (קצבת זקנה) when each person reaches 70
-        if not old_age_pension1_active and age1 >= params.old_age_pension_start_age:
-            old_age_pension1_active = True
-
-        if not old_age_pension2_active and age2 >= params.old_age_pension_start_age:
-            old_age_pension2_active = True
-
-        # Calculate old age pension amounts first (needed for tax calculation)
-        old_age_pension1_amount = params.old_age_pension_month if old_age_pension1_active else 0.0
-        old_age_pension2_amount = params.old_age_pension_month if old_age_pension2_active else 0.0
-        total_old_age_pension = old_age_pension1_amount + old_age_pension2_amount
-
-        # Calculate total pension income this month (after tax)
-        # Tax is applied to pension income, with first ₪5K per person tax-free
-        total_pension_income_net = 0.0
-        pension_net_p1 = 0.0
-        pension_net_p2 = 0.0
-        if pension1_income_active:
-            pension_gross_p1 = pension1_income_month
-            # First ₪5K per person is tax-free
-            taxable_pension_p1 = max(0.0, pension_gross_p1 - params.pension_tax_free_amount)
-            pension_tax_p1 = calculate_monthly_tax_from_gross(taxable_pension_p1)
-            pension_net_p1 = pension_gross_p1 - pension_tax_p1
-            total_pension_income_net += pension_net_p1
-            pension1 -= pension_gross_p1
-        if pension2_income_active:
-            pension_gross_p2 = pension2_income_month
-            # First ₪5K per person is tax-free
-            taxable_pension_p2 = max(0.0, pension_gross_p2 - params.pension_tax_free_amount)
-            pension_tax_p2 = calculate_monthly_tax_from_gross(taxable_pension_p2)
-            pension_net_p2 = pension_gross_p2 - pension_tax_p2
-            total_pension_income_net += pension_net_p2
-            pension2 -= pension_gross_p2
-
-        # Add pension income to nontaxable liquid (it's net income, already taxed)
-        liquid_nontaxable += total_pension_income_net
-
-        # Add old age pension to nontaxable liquid (it's net income, typically tax-free)
-        liquid_nontaxable += total_old_age_pension
-
-        # Calculate total income from all sources (salary + pension + old age pension)
-        total_income_this_month = net_income_this_month + total_pension_income_net + total_old_age_pension
-
-        # Get monthly spending at current age (may change based on expense schedule)
-        current_monthly_expense = get_expense_at_age(age1, params.spend_month, params.expense_schedule)
-
-        # Calculate total income to liquid (before deducting expenses)
-        total_income_to_liquid = (net_income_this_month + total_pension_income_net +
-                                  total_old_age_pension + hishtalmut1 + hishtalmut2 +
-                                  one_time_event_amount)
-
-        # Calculate if we're withdrawing from liquid assets beyond current income
-        # Shortfall occurs when expenses exceed all income sources
-        shortfall = current_monthly_expense - total_income_to_liquid
-        liquid_withdrawal_tax = 0.0
-
-        # Always deduct expenses from liquid
-        # First, deduct from nontaxable (where income was added)
-        liquid_nontaxable -= current_monthly_expense
-
-        # If expenses exceeded income (shortfall > 0), we withdrew from existing assets
-        # Apply withdrawal tax on the taxable portion of the excess withdrawal
-        if shortfall > 0:
-            # Calculate total liquid and taxable percentage BEFORE the expense deduction
-            total_liquid_before = liquid_nontaxable + current_monthly_expense + liquid_taxable
-
-            if total_liquid_before > 0:
-                taxable_pct = liquid_taxable / total_liquid_before
-            else:
-                taxable_pct = 0.0
-
-            # Calculate tax only on the taxable portion of the shortfall
-            taxable_portion_of_shortfall = shortfall * taxable_pct
-            liquid_withdrawal_tax = taxable_portion_of_shortfall * params.liquid_withdrawal_tax_rate
-
-            # Deduct the withdrawal tax proportionally from both buckets
-            total_liquid_now = liquid_nontaxable + liquid_taxable
-            if total_liquid_now > 0:
-                nontaxable_tax = liquid_withdrawal_tax * (liquid_nontaxable / total_liquid_now)
-                taxable_tax = liquid_withdrawal_tax * (liquid_taxable / total_liquid_now)
-
-                liquid_nontaxable -= nontaxable_tax
-                liquid_taxable -= taxable_tax
+    # Run the numeric kernel (JIT-compiled when numba is available)
+    (liquid_arr, pension1_arr, pension2_arr,
+     pension1_income_arr, pension2_income_arr,
+     pension1_income_net_arr, pension2_income_net_arr,
+     total_pension_income_arr, old_age_pension_arr,
+     withdrawal_tax_arr, liquid_change_arr,
+     pension1_income_month, pension2_income_month,
+     liquid_at_first_pension_start, min_assets_violation_month) = _simulate_core(
+        params.r_month,
+        liquid_nontaxable, liquid_taxable,
+        params.pension_now, params.spouse_pension_now,
+        params.mekadem, params.spouse_mekadem,
+        pension_start_month1, pension_start_month2,
+        old_age_start_month1, old_age_start_month2,
+        params.old_age_pension_month, params.pension_tax_free_amount,
+        params.liquid_withdrawal_tax_rate, params.min_assets,
+        salary1_net, salary2_net,
+        hishtalmut1, hishtalmut2,
+        pension_contrib1, pension_contrib2,
+        one_time_event, expense,
+        _TAX_THRESHOLDS, _TAX_RATES, _TAX_BASE,
+        NATIONAL_INSURANCE.rate_low, NATIONAL_INSURANCE.rate_high,
+        NATIONAL_INSURANCE.threshold_low_monthly, NATIONAL_INSURANCE.cap_monthly,
+        False
+    )
 
-        # Recalculate total liquid
-        liquid = liquid_nontaxable + liquid_taxable
+    # Pension activation status per month (for phase determination)
+    pension1_income_active_arr = months >= pension_start_month1
+    pension2_income_active_arr = months >= pension_start_month2
+
+    # Determine phase for display: int8 codes from the boolean masks, turned
+    # into one Categorical instead of a per-month string array
+    phase_codes = np.select(
+        [working1 & working2,
+         working1 | working2,
+         ~(pension1_income_active_arr | pension2_income_active_arr)],
+        [0, 1, 2],
+        default=3
+    ).astype(np.int8)
+    phase = pd.Categorical.from_codes(
+        phase_codes,
+        categories=['both_working', 'one_working', 'bridge', 'post_pension']
+    )
 
-        # Track if liquid went below minimum assets threshold (but continue simulation)
-        if not min_assets_violated and liquid < params.min_assets:
-            min_assets_violated = True
-            min_assets_violation_reason = f"Assets fell below minimum (₪{params.min_assets/1000:.0f}K) at person 1 age {age1:.1f}, person 2 age {age2:.1f}"
-
-        # Determine phase for display
-        if person1_working and person2_working:
-            phase = 'both_working'
-        elif person1_working or person2_working:
-            phase = 'one_working'
-        elif not pension1_income_active and not pension2_income_active:
-            phase = 'bridge'
-        else:
-            phase = 'post_pension'
-
-        # Calculate net change to liquid from cash flows (excluding investment returns)
-        # Includes: all income - spending - withdrawal tax
-        liquid_change = total_income_to_liquid - current_monthly_expense - liquid_withdrawal_tax
-
-        records.append({
-            'month': month,
-            'age1': age1,
-            'age2': age2,
-            'phase': phase,
-            'liquid': liquid,
-            'pension1': pension1,
-            'pension2': pension2,
-            # Salary income (Person 1)
-            'salary1_gross': salary1_gross,
-            'salary1_net': salary1_net,
-            'hishtalmut1': hishtalmut1,
-            # Salary income (Person 2)
-            'salary2_gross': salary2_gross,
-            'salary2_net': salary2_net,
-            'hishtalmut2': hishtalmut2,
-            # Pension income
-            'pension1_income': pension1_income_month if pension1_income_active else 0.0,
-            'pension2_income': pension2_income_month if pension2_income_active else 0.0,
-            'pension1_income_net': pension_net_p1,
-            'pension2_income_net': pension_net_p2,
-            # One-time events
-            'one_time_event': one_time_event_amount,
-            'total_pension_income': total_pension_income_net,
-            # Old age pension
-            'old_age_pension': total_old_age_pension,
-            # Spending and net cash flow
-            'monthly_expense': current_monthly_expense,
-            'liquid_withdrawal_tax': liquid_withdrawal_tax,
-            'liquid_change': liquid_change,
-            # Status flags
-            'person1_working': person1_working,
-            'person2_working': person2_working
-        })
-
-    # Create final DataFrame
-    df = pd.DataFrame(records)
-    liquid_end = liquid
+    # Collect the per-month columns; the Result materializes the DataFrame
+    # lazily (pandas wraps same-dtype ndarrays without copying when it does)
+    columns = {
+        'month': months,
+        'age1': ages1,
+        'age2': ages2,
+        'phase': phase,
+        'liquid': liquid_arr,
+        'pension1': pension1_arr,
+        'pension2': pension2_arr,
+        # Salary income (Person 1)
+        'salary1_gross': salary1_gross,
+        'salary1_net': salary1_net,
+        'hishtalmut1': hishtalmut1,
+        # Salary income (Person 2)
+        'salary2_gross': salary2_gross,
+        'salary2_net': salary2_net,
+        'hishtalmut2': hishtalmut2,
+        # Pension income
+        'pension1_income': pension1_income_arr,
+        'pension2_income': pension2_income_arr,
+        'pension1_income_net': pension1_income_net_arr,
+        'pension2_income_net': pension2_income_net_arr,
+        # One-time events
+        'one_time_event': one_time_event,
+        'total_pension_income': total_pension_income_arr,
+        # Old age pension
+        'old_age_pension': old_age_pension_arr,
+        # Spending and net cash flow
+        'monthly_expense': expense,
+        'liquid_withdrawal_tax': withdrawal_tax_arr,
+        'liquid_change': liquid_change_arr,
+        # Status flags
+        'person1_working': working1,
+        'person2_working': working2
+    }
+
+    # Final balances (initial values if the simulation spans zero months)
+    if total_months > 0:
+        liquid_end = float(liquid_arr[-1])
+        pension1_end = float(pension1_arr[-1])
+        pension2_end = float(pension2_arr[-1])
+    else:
+        liquid_end = liquid_nontaxable + liquid_taxable
+        pension1_end = params.pension_now
+        pension2_end = params.spouse_pension_now
+
+    pension1_income_active = pension_start_month1 < total_months
+    pension2_income_active = pension_start_month2 < total_months
 
     # Check if there was any minimum assets violation during simulation
-    if min_assets_violated:
+    if min_assets_violation_month >= 0:
+        violation_age1 = ages1[min_assets_violation_month]
+        violation_age2 = ages2[min_assets_violation_month]
         return Result(
             ok=False,
-            reason=min_assets_violation_reason,
-            df=df,
-            pension_at_start=pension1,
+            reason=f"Assets fell below minimum (₪{params.min_assets/1000:.0f}K) at person 1 age {violation_age1:.1f}, person 2 age {violation_age2:.1f}",
+            columns=columns,
+            pension_at_start=pension1_end,
             pension_income_month=pension1_income_month,
-            spouse_pension_at_start=pension2,
+            spouse_pension_at_start=pension2_end,
             spouse_pension_income_month=pension2_income_month,
             liquid_end=liquid_end,
             liquid_at_pension_start=liquid_at_first_pension_start
@@ -664,10 +836,10 @@ def simulate(retire_age: float, params: Params, spouse_retire_age: Optional[floa
         return Result(
             ok=False,
             reason=f"Assets below minimum (₪{params.min_assets/1000:.0f}K) at end age (₪{liquid_end/1000:.0f}K)",
-            df=df,
-            pension_at_start=pension1,
+            columns=columns,
+            pension_at_start=pension1_end,
             pension_income_month=pension1_income_month,
-            spouse_pension_at_start=pension2,
+            spouse_pension_at_start=pension2_end,
             spouse_pension_income_month=pension2_income_month,
             liquid_end=liquid_end,
             liquid_at_pension_start=liquid_at_first_pension_start
@@ -677,11 +849,297 @@ def simulate(retire_age: float, params: Params, spouse_retire_age: Optional[floa
     return Result(
         ok=True,
         reason="Feasible retirement scenario for both people",
-        df=df,
-        pension_at_start=pension1 if pension1_income_active else 0.0,
+        columns=columns,
+        pension_at_start=pension1_end if pension1_income_active else 0.0,
         pension_income_month=pension1_income_month,
-        spouse_pension_at_start=pension2 if pension2_income_active else 0.0,
+        spouse_pension_at_start=pension2_end if pension2_income_active else 0.0,
         spouse_pension_income_month=pension2_income_month,
         liquid_end=liquid_end,
         liquid_at_pension_start=liquid_at_first_pension_start
     )
+
+
+def simulate_batch(retire_ages: np.ndarray, params: Params,
+                   spouse_retire_ages: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Feasibility of many (retire_age, spouse_retire_age) scenarios in one sweep.
+
+    Scenarios only differ in when the salaries stop, so the setup (ages,
+    schedule expansion, expenses, events) is done once and the salary-side
+    flows are broadcast to [n_scenarios, n_months] arrays; the balance
+    recursion then runs per scenario inside the batched kernel. Each
+    scenario's verdict matches simulate(...).ok exactly, including the
+    validation rejections, at a fraction of the per-call setup cost.
+
+    Args:
+        retire_ages: Candidate retirement ages for Person 1
+        params: Simulation parameters
+        spouse_retire_ages: Candidate retirement ages for Person 2, aligned
+            with retire_ages (defaults to params.spouse_retire_age for all)
+
+    Returns:
+        Boolean array, True where the scenario is feasible
+    """
+    retire_ages = np.asarray(retire_ages, dtype=np.float64)
+    if spouse_retire_ages is None:
+        spouse_retire_ages = np.full(len(retire_ages), params.spouse_retire_age)
+    else:
+        spouse_retire_ages = np.asarray(spouse_retire_ages, dtype=np.float64)
+
+    feasible = np.zeros(len(retire_ages), dtype=bool)
+
+    # Scenario-independent validation: any failure here makes simulate()
+    # reject every candidate
+    if params.income_schedule:
+        for schedule_age, schedule_income in params.income_schedule:
+            if schedule_age < params.age_now or schedule_income < 0:
+                return feasible
+    if params.spouse_income_schedule:
+        for schedule_age, schedule_income in params.spouse_income_schedule:
+            if schedule_age < params.spouse_age_now or schedule_income < 0:
+                return feasible
+    if params.one_time_events:
+        for event_age, amount, description in params.one_time_events:
+            if event_age < params.age_now or event_age > params.end_age:
+                return feasible
+    if params.expense_schedule:
+        for schedule_age, schedule_expense in params.expense_schedule:
+            if (schedule_age < params.age_now or schedule_age > params.end_age
+                    or schedule_expense < 0):
+                return feasible
+
+    # Per-scenario validation: retirement after pension start, or a schedule
+    # entry at/after the retirement age, is rejected by simulate()
+    max_schedule_age1 = (max(entry[0] for entry in params.income_schedule)
+                         if params.income_schedule else -np.inf)
+    max_schedule_age2 = (max(entry[0] for entry in params.spouse_income_schedule)
+                         if params.spouse_income_schedule else -np.inf)
+    runnable = ((retire_ages <= params.pension_start_age)
+                & (spouse_retire_ages <= params.spouse_pension_start_age)
+                & (retire_ages > max_schedule_age1)
+                & (spouse_retire_ages > max_schedule_age2))
+    run_idx = np.flatnonzero(runnable)
+    if run_idx.size == 0:
+        return feasible
+
+    older_age_now = max(params.age_now, params.spouse_age_now)
+    total_months = max(0, round((params.end_age - older_age_now) * 12))
+
+    # Split liquid into taxable and non-taxable portions (as in simulate)
+    liquid_nontaxable = params.liquid_now * params.liquid_nontaxable_pct
+    liquid_taxable = params.liquid_now * (1.0 - params.liquid_nontaxable_pct)
+
+    if total_months == 0:
+        feasible[run_idx] = (liquid_nontaxable + liquid_taxable) >= params.min_assets
+        return feasible
+
+    months = np.arange(total_months)
+    ages1 = params.age_now + months / 12
+    ages2 = params.spouse_age_now + months / 12
+
+    # Salary-side flows per scenario: the base income series is shared, each
+    # scenario only applies its own working mask
+    base_gross1 = _piecewise_from_schedule(ages1, params.gross_income_month, params.income_schedule_arrays)
+    base_gross2 = _piecewise_from_schedule(ages2, params.spouse_gross_income_month, params.spouse_income_schedule_arrays)
+    gross1 = np.where(ages1[None, :] < retire_ages[run_idx][:, None], base_gross1[None, :], 0.0)
+    gross2 = np.where(ages2[None, :] < spouse_retire_ages[run_idx][:, None], base_gross2[None, :], 0.0)
+
+    after_tax1 = net_from_gross_vec(gross1)
+    after_tax2 = net_from_gross_vec(gross2)
+
+    employee_pension1 = gross1 * params.pension_rate
+    employee_pension2 = gross2 * params.spouse_pension_rate
+    capped_salary1 = np.minimum(gross1, params.hishtalmut_salary_cap)
+    employee_hishtalmut1 = capped_salary1 * params.hishtalmut_rate_employee
+    capped_salary2 = np.minimum(gross2, params.spouse_hishtalmut_salary_cap)
+    employee_hishtalmut2 = capped_salary2 * params.spouse_hishtalmut_rate_employee
+
+    salary1_net = after_tax1 - employee_pension1 - employee_hishtalmut1
+    salary2_net = after_tax2 - employee_pension2 - employee_hishtalmut2
+    hishtalmut1 = employee_hishtalmut1 + capped_salary1 * params.hishtalmut_rate_employer
+    hishtalmut2 = employee_hishtalmut2 + capped_salary2 * params.spouse_hishtalmut_rate_employer
+    pension_contrib1 = employee_pension1 + gross1 * params.pension_rate_employer
+    pension_contrib2 = employee_pension2 + gross2 * params.spouse_pension_rate_employer
+
+    expense = _piecewise_from_schedule(ages1, params.spend_month, params.expense_schedule_arrays)
+    expense_rows = np.repeat(expense[None, :], run_idx.size, axis=0)
+
+    one_time_event = np.zeros(total_months)
+    if params.one_time_events:
+        for event_age, amount, description in params.one_time_events:
+            event_month = _first_month_reaching(ages1, event_age)
+            if event_month < total_months:
+                one_time_event[event_month] += amount
+
+    pension_start_month1 = _first_month_reaching(ages1, params.pension_start_age)
+    pension_start_month2 = _first_month_reaching(ages2, params.spouse_pension_start_age)
+    old_age_start_month1 = _first_month_reaching(ages1, params.old_age_pension_start_age)
+    old_age_start_month2 = _first_month_reaching(ages2, params.old_age_pension_start_age)
+
+    liquid_end, violation_month = _simulate_core_batch(
+        params.r_month,
+        liquid_nontaxable, liquid_taxable,
+        params.pension_now, params.spouse_pension_now,
+        params.mekadem, params.spouse_mekadem,
+        pension_start_month1, pension_start_month2,
+        old_age_start_month1, old_age_start_month2,
+        params.old_age_pension_month, params.pension_tax_free_amount,
+        params.liquid_withdrawal_tax_rate, params.min_assets,
+        salary1_net, salary2_net,
+        hishtalmut1, hishtalmut2,
+        pension_contrib1, pension_contrib2,
+        one_time_event, expense_rows,
+        _TAX_THRESHOLDS, _TAX_RATES, _TAX_BASE,
+        NATIONAL_INSURANCE.rate_low, NATIONAL_INSURANCE.rate_high,
+        NATIONAL_INSURANCE.threshold_low_monthly, NATIONAL_INSURANCE.cap_monthly
+    )
+
+    feasible[run_idx] = (violation_month < 0) & (liquid_end >= params.min_assets)
+    return feasible
+
+
+def simulate_spend_batch(spend_levels: np.ndarray, params: Params,
+                         retire_age: Optional[float] = None,
+                         spouse_retire_age: Optional[float] = None
+                         ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Feasibility and final liquid balance for many spending levels in one sweep.
+
+    The dual of simulate_batch: retirement ages are fixed and the scenarios
+    only differ in the base monthly spend, so the salary-side flows are
+    computed once and shared while the expense series gets one row per
+    candidate (expense-schedule entries override the base spend, so only
+    pre-schedule months vary). Used by the max-expense search to evaluate a
+    whole candidate grid per kernel call instead of one bisection probe.
+
+    Args:
+        spend_levels: Candidate values for params.spend_month
+        params: Simulation parameters (spend_month itself is ignored)
+        retire_age: Person 1 retirement age (defaults to params.retire_age)
+        spouse_retire_age: Person 2 retirement age (defaults to params.spouse_retire_age)
+
+    Returns:
+        Tuple of (feasible boolean array, final liquid balance array), both
+        aligned with spend_levels; feasibility matches simulate(...).ok.
+        Candidates that violate min_assets mid-run stop simulating at the
+        violation, so their liquid_end is NaN.
+    """
+    spend_levels = np.asarray(spend_levels, dtype=np.float64)
+    if retire_age is None:
+        retire_age = params.retire_age
+    if spouse_retire_age is None:
+        spouse_retire_age = params.spouse_retire_age
+
+    n_levels = len(spend_levels)
+    feasible = np.zeros(n_levels, dtype=bool)
+    liquid_end = np.zeros(n_levels)
+
+    # Validation mirror of simulate(): none of the checks depend on
+    # spend_month, so a failure rejects every candidate
+    if (retire_age > params.pension_start_age
+            or spouse_retire_age > params.spouse_pension_start_age):
+        return feasible, liquid_end
+    if params.income_schedule:
+        for schedule_age, schedule_income in params.income_schedule:
+            if (schedule_age < params.age_now or schedule_age >= retire_age
+                    or schedule_income < 0):
+                return feasible, liquid_end
+    if params.spouse_income_schedule:
+        for schedule_age, schedule_income in params.spouse_income_schedule:
+            if (schedule_age < params.spouse_age_now or schedule_age >= spouse_retire_age
+                    or schedule_income < 0):
+                return feasible, liquid_end
+    if params.one_time_events:
+        for event_age, amount, description in params.one_time_events:
+            if event_age < params.age_now or event_age > params.end_age:
+                return feasible, liquid_end
+    if params.expense_schedule:
+        for schedule_age, schedule_expense in params.expense_schedule:
+            if (schedule_age < params.age_now or schedule_age > params.end_age
+                    or schedule_expense < 0):
+                return feasible, liquid_end
+
+    older_age_now = max(params.age_now, params.spouse_age_now)
+    total_months = max(0, round((params.end_age - older_age_now) * 12))
+
+    liquid_nontaxable = params.liquid_now * params.liquid_nontaxable_pct
+    liquid_taxable = params.liquid_now * (1.0 - params.liquid_nontaxable_pct)
+
+    if total_months == 0:
+        liquid_end[:] = liquid_nontaxable + liquid_taxable
+        feasible[:] = liquid_end >= params.min_assets
+        return feasible, liquid_end
+
+    months = np.arange(total_months)
+    ages1 = params.age_now + months / 12
+    ages2 = params.spouse_age_now + months / 12
+
+    # Salary-side flows are identical for every candidate; compute the 1D
+    # series once (as in simulate) and repeat the rows for the batch kernel
+    gross1 = np.where(ages1 < retire_age,
+                      _piecewise_from_schedule(ages1, params.gross_income_month, params.income_schedule_arrays), 0.0)
+    gross2 = np.where(ages2 < spouse_retire_age,
+                      _piecewise_from_schedule(ages2, params.spouse_gross_income_month, params.spouse_income_schedule_arrays), 0.0)
+
+    after_tax1 = net_from_gross_vec(gross1)
+    after_tax2 = net_from_gross_vec(gross2)
+
+    employee_pension1 = gross1 * params.pension_rate
+    employee_pension2 = gross2 * params.spouse_pension_rate
+    capped_salary1 = np.minimum(gross1, params.hishtalmut_salary_cap)
+    employee_hishtalmut1 = capped_salary1 * params.hishtalmut_rate_employee
+    capped_salary2 = np.minimum(gross2, params.spouse_hishtalmut_salary_cap)
+    employee_hishtalmut2 = capped_salary2 * params.spouse_hishtalmut_rate_employee
+
+    salary1_net = np.repeat((after_tax1 - employee_pension1 - employee_hishtalmut1)[None, :], n_levels, axis=0)
+    salary2_net = np.repeat((after_tax2 - employee_pension2 - employee_hishtalmut2)[None, :], n_levels, axis=0)
+    hishtalmut1 = np.repeat((employee_hishtalmut1 + capped_salary1 * params.hishtalmut_rate_employer)[None, :], n_levels, axis=0)
+    hishtalmut2 = np.repeat((employee_hishtalmut2 + capped_salary2 * params.spouse_hishtalmut_rate_employer)[None, :], n_levels, axis=0)
+    pension_contrib1 = np.repeat((employee_pension1 + gross1 * params.pension_rate_employer)[None, :], n_levels, axis=0)
+    pension_contrib2 = np.repeat((employee_pension2 + gross2 * params.spouse_pension_rate_employer)[None, :], n_levels, axis=0)
+
+    # Expense rows: schedule entries override the base spend from their age
+    # onward, so each candidate only differs in the pre-schedule months
+    if params.expense_schedule_arrays is not None:
+        schedule_ages = params.expense_schedule_arrays[0]
+        base_months = np.searchsorted(schedule_ages, ages1, side='right') == 0
+        scheduled = _piecewise_from_schedule(ages1, 0.0, params.expense_schedule_arrays)
+        expense_rows = np.where(base_months[None, :], spend_levels[:, None], scheduled[None, :])
+    else:
+        expense_rows = np.repeat(spend_levels[:, None], total_months, axis=1)
+
+    one_time_event = np.zeros(total_months)
+    if params.one_time_events:
+        for event_age, amount, description in params.one_time_events:
+            event_month = _first_month_reaching(ages1, event_age)
+            if event_month < total_months:
+                one_time_event[event_month] += amount
+
+    pension_start_month1 = _first_month_reaching(ages1, params.pension_start_age)
+    pension_start_month2 = _first_month_reaching(ages2, params.spouse_pension_start_age)
+    old_age_start_month1 = _first_month_reaching(ages1, params.old_age_pension_start_age)
+    old_age_start_month2 = _first_month_reaching(ages2, params.old_age_pension_start_age)
+
+    liquid_end, violation_month = _simulate_core_batch(
+        params.r_month,
+        liquid_nontaxable, liquid_taxable,
+        params.pension_now, params.spouse_pension_now,
+        params.mekadem, params.spouse_mekadem,
+        pension_start_month1, pension_start_month2,
+        old_age_start_month1, old_age_start_month2,
+        params.old_age_pension_month, params.pension_tax_free_amount,
+        params.liquid_withdrawal_tax_rate, params.min_assets,
+        salary1_net, salary2_net,
+        hishtalmut1, hishtalmut2,
+        pension_contrib1, pension_contrib2,
+        one_time_event, expense_rows,
+        _TAX_THRESHOLDS, _TAX_RATES, _TAX_BASE,
+        NATIONAL_INSURANCE.rate_low, NATIONAL_INSURANCE.rate_high,
+        NATIONAL_INSURANCE.threshold_low_monthly, NATIONAL_INSURANCE.cap_monthly
+    )
+
+    no_violation = violation_month < 0
+    feasible = no_violation & (liquid_end >= params.min_assets)
+    # Violated runs break out of the kernel early; whatever is left in their
+    # final-balance slot is not a simulated value
+    return feasible, np.where(no_violation, liquid_end, np.nan)
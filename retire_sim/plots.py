@@ -2,10 +2,63 @@
 Plotting utilities for financial simulation results.
 """
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+# Anchor settings matching plotly's add_vline annotation_position values.
+_VLINE_ANNOTATION_ANCHORS = {
+    'top': dict(xanchor='center', y=1, yanchor='bottom'),
+    'bottom': dict(xanchor='center', y=0, yanchor='top'),
+    'top right': dict(xanchor='left', y=1, yanchor='top'),
+    'bottom right': dict(xanchor='left', y=0, yanchor='bottom'),
+    'top left': dict(xanchor='right', y=1, yanchor='top'),
+    'bottom left': dict(xanchor='right', y=0, yanchor='bottom'),
+}
+
+# (xref, yref) per subplot row for full-height vertical lines.
+_VLINE_ROW_REFS = {1: ('x', 'y domain'), 2: ('x2', 'y2 domain')}
+
+
+def _append_vline(
+    shapes: list,
+    annotations: list,
+    x: float,
+    line_dash: str,
+    line_color: str,
+    annotation_text: str,
+    annotation_position: str,
+    opacity: float = None,
+    font_size: int = None,
+    annotate_row: int = 1,
+):
+    """
+    Append the shape/annotation dicts for one vertical marker line on both
+    subplot rows. Equivalent to fig.add_vline per row, but collecting plain
+    dicts lets the caller apply them all in a single update_layout call
+    instead of relayouting the figure once per line.
+    """
+    for row in (1, 2):
+        xref, yref = _VLINE_ROW_REFS[row]
+        shape = dict(
+            type='line', x0=x, x1=x, y0=0, y1=1,
+            xref=xref, yref=yref,
+            line=dict(dash=line_dash, color=line_color)
+        )
+        if opacity is not None:
+            shape['opacity'] = opacity
+        shapes.append(shape)
+
+        annotation = dict(
+            text=annotation_text if row == annotate_row else '',
+            x=x, xref=xref, yref=yref, showarrow=False,
+            **_VLINE_ANNOTATION_ANCHORS[annotation_position]
+        )
+        if font_size is not None:
+            annotation['font'] = dict(size=font_size)
+        annotations.append(annotation)
+
 
 def plot_combined(
     df: pd.DataFrame,
@@ -42,227 +95,209 @@ def plot_combined(
         row_heights=[0.5, 0.5]
     )
 
+    # Collect all traces and add them in one call - each add_trace would
+    # otherwise revalidate and extend the figure individually.
+    traces = []
+    trace_rows = []
+
+    # age1 is a monotonic monthly grid, so plain arrays + searchsorted slices
+    # replace boolean-mask filtering (which allocates a full temporary
+    # DataFrame per pension series).
+    #
+    # For very long horizons, decimate to ~600 points per trace: monthly
+    # resolution beyond that is not visually distinguishable and only
+    # inflates the serialized figure. Typical horizons (<= 50 years) keep
+    # full monthly resolution.
+    stride = max(len(df) // 600, 1)
+
+    def column(name):
+        return df[name].to_numpy()[::stride]
+
+    ages = column('age1')
+
     # Balances
-    fig.add_trace(
-        go.Scatter(
-            x=df['age1'], y=df['liquid'],
-            name='Liquid (Combined)',
-            line=dict(color='blue', width=2),
-            legendgroup='balances'
-        ),
-        row=1, col=1
-    )
+    traces.append(go.Scattergl(
+        x=ages, y=column('liquid'),
+        name='Liquid (Combined)',
+        line=dict(color='blue', width=2),
+        legendgroup='balances'
+    ))
+    trace_rows.append(1)
 
-    # Filter pension1 data to only show until pension start age
-    df_pension1 = df[df['age1'] <= pension_start_age1]
-    fig.add_trace(
-        go.Scatter(
-            x=df_pension1['age1'], y=df_pension1['pension1'],
-            name='Pension 1',
-            line=dict(color='green', width=2),
-            legendgroup='balances'
-        ),
-        row=1, col=1
-    )
+    # Show pension1 data only until pension start age
+    idx1 = np.searchsorted(ages, pension_start_age1, side='right')
+    traces.append(go.Scattergl(
+        x=ages[:idx1], y=column('pension1')[:idx1],
+        name='Pension 1',
+        line=dict(color='green', width=2),
+        legendgroup='balances'
+    ))
+    trace_rows.append(1)
 
-    # Filter pension2 data to only show until pension start age
-    df_pension2 = df[df['age1'] <= pension_start_age2]
-    fig.add_trace(
-        go.Scatter(
-            x=df_pension2['age1'], y=df_pension2['pension2'],
-            name='Pension 2',
-            line=dict(color='lightgreen', width=2, dash='dash'),
-            legendgroup='balances'
-        ),
-        row=1, col=1
-    )
+    # Show pension2 data only until pension start age
+    idx2 = np.searchsorted(ages, pension_start_age2, side='right')
+    traces.append(go.Scattergl(
+        x=ages[:idx2], y=column('pension2')[:idx2],
+        name='Pension 2',
+        line=dict(color='lightgreen', width=2, dash='dash'),
+        legendgroup='balances'
+    ))
+    trace_rows.append(1)
 
     # Cashflows - Stacked area chart showing all income sources
+    # (these stay go.Scatter: plotly.js scattergl has no stackgroup support)
     # Order from bottom to top: Salary 2, Salary 1, Old Age Pension, Pension 2, Pension 1, Asset Withdrawal
 
     # Net Salary Person 2 (bottom layer)
-    fig.add_trace(
-        go.Scatter(
-            x=df['age1'], y=df['salary2_net'],
-            name='Net Salary Person 2',
-            line=dict(color='lightblue', width=2),
-            legendgroup='cashflows',
-            stackgroup='income',
-            fillcolor='lightblue'
-        ),
-        row=2, col=1
-    )
+    traces.append(go.Scatter(
+        x=ages, y=column('salary2_net'),
+        name='Net Salary Person 2',
+        line=dict(color='lightblue', width=2),
+        legendgroup='cashflows',
+        stackgroup='income',
+        fillcolor='lightblue'
+    ))
+    trace_rows.append(2)
 
     # Net Salary Person 1
-    fig.add_trace(
-        go.Scatter(
-            x=df['age1'], y=df['salary1_net'],
-            name='Net Salary Person 1',
-            line=dict(color='cornflowerblue', width=2),
-            legendgroup='cashflows',
-            stackgroup='income',
-            fillcolor='cornflowerblue'
-        ),
-        row=2, col=1
-    )
+    traces.append(go.Scatter(
+        x=ages, y=column('salary1_net'),
+        name='Net Salary Person 1',
+        line=dict(color='cornflowerblue', width=2),
+        legendgroup='cashflows',
+        stackgroup='income',
+        fillcolor='cornflowerblue'
+    ))
+    trace_rows.append(2)
 
     # Old Age Pension (קצבת זקנה)
     if 'old_age_pension' in df.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=df['age1'], y=df['old_age_pension'],
-                name='Old Age Pension (קצבת זקנה)',
-                line=dict(color='purple', width=2),
-                legendgroup='cashflows',
-                stackgroup='income',
-                fillcolor='purple'
-            ),
-            row=2, col=1
-        )
-
-    # Pension 2 Income (Net)
-    fig.add_trace(
-        go.Scatter(
-            x=df['age1'], y=df['pension2_income_net'],
-            name='Pension 2 Income (Net)',
-            line=dict(color='lightgreen', width=2),
+        traces.append(go.Scatter(
+            x=ages, y=column('old_age_pension'),
+            name='Old Age Pension (קצבת זקנה)',
+            line=dict(color='purple', width=2),
             legendgroup='cashflows',
             stackgroup='income',
-            fillcolor='lightgreen'
-        ),
-        row=2, col=1
-    )
-    
+            fillcolor='purple'
+        ))
+        trace_rows.append(2)
+
+    # Pension 2 Income (Net)
+    traces.append(go.Scatter(
+        x=ages, y=column('pension2_income_net'),
+        name='Pension 2 Income (Net)',
+        line=dict(color='lightgreen', width=2),
+        legendgroup='cashflows',
+        stackgroup='income',
+        fillcolor='lightgreen'
+    ))
+    trace_rows.append(2)
+
     # Pension 1 Income (Net)
-    fig.add_trace(
-        go.Scatter(
-            x=df['age1'], y=df['pension1_income_net'],
-            name='Pension 1 Income (Net)',
-            line=dict(color='green', width=2),
-            legendgroup='cashflows',
-            stackgroup='income',
-            fillcolor='green'
-        ),
-        row=2, col=1
-    )
+    traces.append(go.Scatter(
+        x=ages, y=column('pension1_income_net'),
+        name='Pension 1 Income (Net)',
+        line=dict(color='green', width=2),
+        legendgroup='cashflows',
+        stackgroup='income',
+        fillcolor='green'
+    ))
+    trace_rows.append(2)
 
     # Add line for monthly expenses (on top of stacked cashflows)
     # This line will change over time if there's an expense schedule
-    fig.add_trace(
-        go.Scatter(
-            x=df['age1'],
-            y=df['monthly_expense'],
-            name='Monthly Expenses',
-            line=dict(color='red', width=3, dash='solid'),
-            legendgroup='cashflows',
-            mode='lines',
-            showlegend=True
-        ),
-        row=2, col=1
-    )
+    traces.append(go.Scattergl(
+        x=ages,
+        y=column('monthly_expense'),
+        name='Monthly Expenses',
+        line=dict(color='red', width=3, dash='solid'),
+        legendgroup='cashflows',
+        mode='lines',
+        showlegend=True
+    ))
+    trace_rows.append(2)
 
-    # Add vertical lines for Person 1
-    for row in [1, 2]:
-        fig.add_vline(
-            x=retire_age1,
-            line_dash="dash",
-            line_color="red",
-            row=row, col=1,
-            annotation_text=f"P1 Retire ({retire_age1:.0f})" if row == 1 else "",
-            annotation_position="top"
-        )
-        fig.add_vline(
-            x=pension_start_age1,
-            line_dash="dash",
-            line_color="orange",
-            row=row, col=1,
-            annotation_text=f"P1 Pension ({pension_start_age1:.0f})" if row == 1 else "",
-            annotation_position="top"
-        )
+    fig.add_traces(traces, rows=trace_rows, cols=[1] * len(traces))
+
+    # Vertical marker lines: collect shapes/annotations as dicts and apply
+    # them in a single update_layout below instead of one add_vline each.
+    shapes = []
+    annotations = []
 
-    # Add vertical lines for Person 2 (if different ages)
+    # Vertical lines for Person 1
+    _append_vline(
+        shapes, annotations, retire_age1,
+        line_dash='dash', line_color='red',
+        annotation_text=f"P1 Retire ({retire_age1:.0f})",
+        annotation_position='top'
+    )
+    _append_vline(
+        shapes, annotations, pension_start_age1,
+        line_dash='dash', line_color='orange',
+        annotation_text=f"P1 Pension ({pension_start_age1:.0f})",
+        annotation_position='top'
+    )
+
+    # Vertical lines for Person 2 (if different ages)
     if abs(retire_age2 - retire_age1) > 0.5:
-        for row in [1, 2]:
-            fig.add_vline(
-                x=retire_age2,
-                line_dash="dot",
-                line_color="darkred",
-                row=row, col=1,
-                annotation_text=f"P2 Retire ({retire_age2:.0f})" if row == 1 else "",
-                annotation_position="bottom"
-            )
+        _append_vline(
+            shapes, annotations, retire_age2,
+            line_dash='dot', line_color='darkred',
+            annotation_text=f"P2 Retire ({retire_age2:.0f})",
+            annotation_position='bottom'
+        )
 
     if abs(pension_start_age2 - pension_start_age1) > 0.5:
-        for row in [1, 2]:
-            fig.add_vline(
-                x=pension_start_age2,
-                line_dash="dot",
-                line_color="darkorange",
-                row=row, col=1,
-                annotation_text=f"P2 Pension ({pension_start_age2:.0f})" if row == 1 else "",
-                annotation_position="bottom"
-            )
+        _append_vline(
+            shapes, annotations, pension_start_age2,
+            line_dash='dot', line_color='darkorange',
+            annotation_text=f"P2 Pension ({pension_start_age2:.0f})",
+            annotation_position='bottom'
+        )
 
-    # Add vertical lines for income schedule changes
+    # Vertical lines for income schedule changes
     if income_schedule1:
-        for idx, (age, income) in enumerate(income_schedule1):
-            for row in [1, 2]:
-                fig.add_vline(
-                    x=age,
-                    line_dash="dashdot",
-                    line_color="blue",
-                    opacity=0.5,
-                    row=row, col=1,
-                    annotation_text=f"P1 Income: ₪{income/1000:.0f}K" if row == 2 else "",
-                    annotation_position="top right",
-                    annotation_font_size=10
-                )
+        for age, income in income_schedule1:
+            _append_vline(
+                shapes, annotations, age,
+                line_dash='dashdot', line_color='blue', opacity=0.5,
+                annotation_text=f"P1 Income: ₪{income/1000:.0f}K",
+                annotation_position='top right',
+                font_size=10, annotate_row=2
+            )
 
     if income_schedule2:
-        for idx, (age, income) in enumerate(income_schedule2):
-            for row in [1, 2]:
-                fig.add_vline(
-                    x=age,
-                    line_dash="dashdot",
-                    line_color="lightblue",
-                    opacity=0.5,
-                    row=row, col=1,
-                    annotation_text=f"P2 Income: ₪{income/1000:.0f}K" if row == 2 else "",
-                    annotation_position="bottom right",
-                    annotation_font_size=10
-                )
-
-    # Add markers for one-time events
+        for age, income in income_schedule2:
+            _append_vline(
+                shapes, annotations, age,
+                line_dash='dashdot', line_color='lightblue', opacity=0.5,
+                annotation_text=f"P2 Income: ₪{income/1000:.0f}K",
+                annotation_position='bottom right',
+                font_size=10, annotate_row=2
+            )
+
+    # Markers for one-time events
     if one_time_events:
-        for idx, (age, amount, description) in enumerate(one_time_events):
-            event_type = "Income" if amount > 0 else "Expense"
+        for age, amount, description in one_time_events:
             color = "green" if amount > 0 else "red"
-            for row in [1, 2]:
-                fig.add_vline(
-                    x=age,
-                    line_dash="dot",
-                    line_color=color,
-                    opacity=0.6,
-                    row=row, col=1,
-                    annotation_text=f"{description}: ₪{abs(amount)/1000:.0f}K" if row == 1 else "",
-                    annotation_position="top left",
-                    annotation_font_size=9
-                )
-
-    # Add vertical lines for expense schedule changes
+            _append_vline(
+                shapes, annotations, age,
+                line_dash='dot', line_color=color, opacity=0.6,
+                annotation_text=f"{description}: ₪{abs(amount)/1000:.0f}K",
+                annotation_position='top left',
+                font_size=9
+            )
+
+    # Vertical lines for expense schedule changes
     if expense_schedule:
-        for idx, (age, expense) in enumerate(expense_schedule):
-            for row in [1, 2]:
-                fig.add_vline(
-                    x=age,
-                    line_dash="dashdot",
-                    line_color="darkred",
-                    opacity=0.5,
-                    row=row, col=1,
-                    annotation_text=f"Expense: ₪{expense/1000:.0f}K" if row == 2 else "",
-                    annotation_position="bottom left",
-                    annotation_font_size=10
-                )
+        for age, expense in expense_schedule:
+            _append_vline(
+                shapes, annotations, age,
+                line_dash='dashdot', line_color='darkred', opacity=0.5,
+                annotation_text=f"Expense: ₪{expense/1000:.0f}K",
+                annotation_position='bottom left',
+                font_size=10, annotate_row=2
+            )
 
     fig.update_xaxes(title_text="Person 1 Age", row=2, col=1)
     fig.update_yaxes(title_text="Balance (NIS)", row=1, col=1)
@@ -277,7 +312,10 @@ def plot_combined(
             y=0.5,
             xanchor='left',
             yanchor='middle'
-        )
+        ),
+        shapes=shapes,
+        # Keep the subplot titles make_subplots already placed
+        annotations=list(fig.layout.annotations) + annotations,
     )
 
     return fig
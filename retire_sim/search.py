@@ -2,8 +2,81 @@
 Solver for finding earliest feasible retirement age.
 """
 
+import concurrent.futures
+import dataclasses
+from functools import lru_cache
 from typing import Optional, Tuple
-from retire_sim.model import Params, Result, simulate
+
+import numpy as np
+
+from retire_sim.model import (Params, Result, _piecewise_from_schedule, simulate,
+                              simulate_batch, simulate_spend_batch)
+
+
+@lru_cache(maxsize=256)
+def _simulate_cached(retire_age: float, params: Params,
+                     spouse_retire_age: float) -> Result:
+    """Memoized simulate() for the search routines.
+
+    The searches and the UI revisit identical (ages, params) combinations -
+    a bisection probe, then the re-simulation of the winner, then a rerun
+    with unchanged inputs - and Params is frozen and hashable, so repeats
+    are free. Keyed on the exact age floats: candidates come off fixed
+    monthly grids, so the same scenario produces bit-identical keys and
+    rounding would only blur distinct scenarios together.
+    """
+    return simulate(retire_age, params, spouse_retire_age)
+
+
+def _simulate_scenario(args: tuple) -> Result:
+    """Run one (params, retire_age, spouse_retire_age) scenario.
+
+    Module-level (rather than a closure) so it stays picklable should the
+    executor in compare_scenarios ever switch to a process pool.
+    """
+    params, retire_age, spouse_retire_age = args
+    return _simulate_cached(retire_age, params, spouse_retire_age)
+
+
+def _bisect_first_feasible(n_candidates, run_candidate):
+    """Find the first feasible index of a monotone candidate sequence.
+
+    run_candidate(i) -> Result must be monotone: once a candidate is
+    feasible, all later ones are too. Brackets the flip with an exponential
+    probe, then binary-searches the bracket, simulating O(log n) candidates.
+
+    Returns (index, result) of the first feasible candidate, or (None, None).
+    """
+    if n_candidates == 0:
+        return None, None
+
+    results = {}
+
+    def feasible(i: int) -> bool:
+        if i not in results:
+            results[i] = run_candidate(i)
+        return results[i].ok
+
+    if feasible(0):
+        return 0, results[0]
+    last = n_candidates - 1
+    if not feasible(last):
+        return None, None
+
+    # Exponential probe: double the step until a feasible candidate brackets
+    # the flip between lo (infeasible) and hi (feasible)
+    lo, hi = 0, 1
+    while hi < last and not feasible(hi):
+        lo, hi = hi, min(hi * 2, last)
+
+    # Binary search within the bracket
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if feasible(mid):
+            hi = mid
+        else:
+            lo = mid
+    return hi, results[hi]
 
 
 def find_earliest_retirement(
@@ -16,6 +89,11 @@ def find_earliest_retirement(
     """
     Find the earliest feasible retirement age for Person 1.
 
+    Feasibility is monotone in the retirement age - working longer only adds
+    income - so instead of simulating every monthly step, the flip point is
+    bracketed with an exponential probe (1, 2, 4, ... steps) and pinned down
+    with a binary search: ~2*log2(N) simulations instead of N.
+
     Args:
         params: Simulation parameters
         min_age: Minimum retirement age to consider for Person 1 (defaults to age_now)
@@ -45,23 +123,105 @@ def find_earliest_retirement(
     if min_age > max_age:
         return None, None
 
-    # Search in monthly steps
+    # Candidate grid in steps of step_months, clamped to max_age. Dividing
+    # the integer month grid by 12 reproduces the former scalar min_age + m/12
+    # values bit-for-bit, so memoized simulations keep their cache keys.
     total_months = round((max_age - min_age) * 12)
-    for m in range(0, total_months + 1, step_months):
-        retire_age = min_age + m / 12
+    month_grid = np.arange(0, total_months + 1, step_months)
+    n_candidates = len(month_grid)
+    candidate_ages = np.minimum(min_age + month_grid / 12, max_age)
+
+    earliest_index, result = _bisect_first_feasible(
+        n_candidates,
+        lambda i: _simulate_cached(float(candidate_ages[i]), params, spouse_retire_age))
+    if earliest_index is None:
+        return None, None
+    return float(candidate_ages[earliest_index]), result
 
-        # Don't exceed max_age
-        if retire_age > max_age:
-            retire_age = max_age
 
-        result = simulate(retire_age, params, spouse_retire_age)
+def sweep_retirement_ages(
+    params: Params,
+    retirement_ages: np.ndarray,
+    spouse_retire_age: Optional[float] = None
+) -> Tuple[np.ndarray, list]:
+    """
+    Evaluate a batch of Person 1 retirement ages in one sweep.
 
-        if result.ok:
-            return retire_age, result
+    Args:
+        params: Simulation parameters
+        retirement_ages: Candidate retirement ages for Person 1
+        spouse_retire_age: Person 2 retirement age (defaults to params.spouse_retire_age)
 
-        # If we've reached max_age, stop
-        if retire_age >= max_age:
-            break
+    Returns:
+        Tuple of (feasible, results): boolean array and list of Result objects,
+        one per candidate age
+    """
+    if spouse_retire_age is None:
+        spouse_retire_age = params.spouse_retire_age
+
+    results = [_simulate_cached(retire_age, params, spouse_retire_age) for retire_age in retirement_ages]
+    feasible = np.array([result.ok for result in results], dtype=bool)
+    return feasible, results
+
+
+def find_earliest_retirement_vec(
+    params: Params,
+    min_age: Optional[float] = None,
+    max_age: Optional[float] = None,
+    spouse_retire_age: Optional[float] = None,
+    step_months: int = 1
+) -> Tuple[Optional[float], Optional[Result]]:
+    """
+    Sweep-based variant of find_earliest_retirement.
+
+    Evaluates the full candidate age grid with one simulate_batch call
+    (shared setup, per-candidate runs of the compiled kernel), picks the
+    first feasible index with np.argmax and re-simulates only the winner for
+    its full Result. Same contract as find_earliest_retirement.
+
+    Args:
+        params: Simulation parameters
+        min_age: Minimum retirement age to consider for Person 1 (defaults to age_now)
+        max_age: Maximum retirement age to consider for Person 1 (defaults to pension_start_age)
+        spouse_retire_age: Person 2 retirement age (defaults to params.spouse_retire_age)
+        step_months: Step size in months for the candidate grid (default 1 month)
+
+    Returns:
+        Tuple of (earliest_retirement_age, result) or (None, None) if none feasible
+    """
+    if min_age is None:
+        min_age = params.age_now
+
+    if max_age is None:
+        max_age = params.pension_start_age
+
+    if spouse_retire_age is None:
+        spouse_retire_age = params.spouse_retire_age
+
+    # Validate bounds
+    if min_age < params.age_now:
+        min_age = params.age_now
+
+    if max_age > params.pension_start_age:
+        max_age = params.pension_start_age
+
+    if min_age > max_age:
+        return None, None
+
+    # Candidate grid in monthly steps, clamped to max_age
+    total_months = round((max_age - min_age) * 12)
+    candidate_ages = np.unique(np.minimum(
+        min_age + np.arange(0, total_months + 1, step_months) / 12,
+        max_age
+    ))
+
+    feasible = simulate_batch(candidate_ages, params,
+                              np.full(len(candidate_ages), spouse_retire_age))
+
+    if feasible.any():
+        first = int(np.argmax(feasible))
+        earliest_age = float(candidate_ages[first])
+        return earliest_age, _simulate_cached(earliest_age, params, spouse_retire_age)
 
     # No feasible retirement age found
     return None, None
@@ -76,6 +236,10 @@ def find_earliest_joint_retirement(
     """
     Find the earliest age at which BOTH people can retire together.
 
+    Uses the same exponential-probe + binary-search bracketing as
+    find_earliest_retirement (feasibility is monotone in the shared
+    retirement age), simulating O(log n) of the candidate pairs.
+
     Args:
         params: Simulation parameters
         min_age: Minimum retirement age to consider (defaults to max of current ages)
@@ -104,22 +268,88 @@ def find_earliest_joint_retirement(
     # Calculate the age for each person when they both retire at same time
     age_diff = params.age_now - params.spouse_age_now
 
-    # Search in monthly steps
+    # Candidate pairs in monthly steps, filtered by the same bounds the
+    # former linear scan applied per step
     total_months = round((max_age - min_age) * 12)
+    candidate_pairs = []
     for m in range(0, total_months + 1, step_months):
         retire_age1 = min_age + m / 12
         retire_age2 = retire_age1 - age_diff
-
-        # Check bounds
         if retire_age1 > params.pension_start_age or retire_age2 > params.spouse_pension_start_age:
             break
         if retire_age1 < params.age_now or retire_age2 < params.spouse_age_now:
             continue
+        candidate_pairs.append((retire_age1, retire_age2))
+
+    earliest_index, result = _bisect_first_feasible(
+        len(candidate_pairs),
+        lambda i: _simulate_cached(candidate_pairs[i][0], params, candidate_pairs[i][1]))
+    if earliest_index is None:
+        return None, None, None
+    retire_age1, retire_age2 = candidate_pairs[earliest_index]
+    return retire_age1, retire_age2, result
+
+
+def find_earliest_joint_retirement_vec(
+    params: Params,
+    min_age: Optional[float] = None,
+    max_age: Optional[float] = None,
+    step_months: int = 1
+) -> Tuple[Optional[float], Optional[float], Optional[Result]]:
+    """
+    Sweep-based variant of find_earliest_joint_retirement.
+
+    Both people retire at the same moment, so the candidate (retire1,
+    retire2) pairs lie on a single line offset by the fixed age difference -
+    the 2D search grid collapses to one axis. The full candidate batch is
+    evaluated with one simulate_batch call (shared setup, per-candidate runs
+    of the compiled kernel), the earliest feasible pair is picked with
+    np.argmax, and only the winner is re-simulated for its full Result.
+    Same contract as find_earliest_joint_retirement.
+
+    Args:
+        params: Simulation parameters
+        min_age: Minimum retirement age to consider (defaults to max of current ages)
+        max_age: Maximum retirement age to consider (defaults to min of pension start ages)
+        step_months: Step size in months for the candidate grid (default 1 month)
+
+    Returns:
+        Tuple of (person1_retire_age, person2_retire_age, result) or (None, None, None) if none feasible
+    """
+    if min_age is None:
+        min_age = max(params.age_now, params.spouse_age_now)
 
-        result = simulate(retire_age1, params, retire_age2)
+    if max_age is None:
+        max_age = min(params.pension_start_age, params.spouse_pension_start_age)
 
-        if result.ok:
-            return retire_age1, retire_age2, result
+    # Validate bounds
+    if min_age < max(params.age_now, params.spouse_age_now):
+        min_age = max(params.age_now, params.spouse_age_now)
+
+    if max_age > min(params.pension_start_age, params.spouse_pension_start_age):
+        max_age = min(params.pension_start_age, params.spouse_pension_start_age)
+
+    if min_age > max_age:
+        return None, None, None
+
+    age_diff = params.age_now - params.spouse_age_now
+
+    # Candidate pairs in monthly steps, filtered by the same bounds as the
+    # sequential search
+    total_months = round((max_age - min_age) * 12)
+    ages1 = min_age + np.arange(0, total_months + 1, step_months) / 12
+    ages2 = ages1 - age_diff
+    valid = ((ages1 <= params.pension_start_age)
+             & (ages2 <= params.spouse_pension_start_age)
+             & (ages1 >= params.age_now)
+             & (ages2 >= params.spouse_age_now))
+    ages1, ages2 = ages1[valid], ages2[valid]
+
+    feasible = simulate_batch(ages1, params, ages2)
+    if feasible.any():
+        first = int(np.argmax(feasible))
+        retire_age1, retire_age2 = float(ages1[first]), float(ages2[first])
+        return retire_age1, retire_age2, _simulate_cached(retire_age1, params, retire_age2)
 
     # No feasible joint retirement age found
     return None, None, None
@@ -128,7 +358,8 @@ def find_earliest_joint_retirement(
 def compare_scenarios(
     params: Params,
     retirement_ages: list[float],
-    spouse_retire_age: Optional[float] = None
+    spouse_retire_age: Optional[float] = None,
+    stop_at_first_feasible: bool = False
 ) -> list[dict]:
     """
     Compare multiple retirement age scenarios for Person 1.
@@ -137,6 +368,13 @@ def compare_scenarios(
         params: Simulation parameters
         retirement_ages: List of retirement ages for Person 1 to test
         spouse_retire_age: Person 2 retirement age (defaults to params.spouse_retire_age)
+        stop_at_first_feasible: If True, sort the ages and exploit the
+            monotonicity of feasibility in retire_age: bisect to the first
+            feasible age, simulate only the ~2*log2(N) probed candidates,
+            and return lightweight rows (feasibility flag only, zeroed
+            metrics) for the ages proven infeasible without running them.
+            Use only when the caller needs feasibility rather than the full
+            per-scenario metrics.
 
     Returns:
         List of dictionaries with scenario results
@@ -144,27 +382,73 @@ def compare_scenarios(
     if spouse_retire_age is None:
         spouse_retire_age = params.spouse_retire_age
 
-    scenarios = []
-
-    for retire_age in retirement_ages:
-        result = simulate(retire_age, params, spouse_retire_age)
-
-        scenarios.append({
-            'retirement_age': retire_age,
-            'spouse_retirement_age': spouse_retire_age,
-            'feasible': result.ok,
-            'reason': result.reason,
-            'liquid_at_pension_start': result.liquid_at_pension_start,
-            'pension_at_start': result.pension_at_start,
-            'pension_income_month': result.pension_income_month,
-            'spouse_pension_at_start': result.spouse_pension_at_start,
-            'spouse_pension_income_month': result.spouse_pension_income_month,
-            'liquid_end': result.liquid_end,
-            'working_years': retire_age - params.age_now,
-            'spouse_working_years': spouse_retire_age - params.spouse_age_now
-        })
-
-    return scenarios
+    if stop_at_first_feasible:
+        return _compare_scenarios_feasibility(params, retirement_ages, spouse_retire_age)
+
+    # Scenarios are independent, so larger batches run on a thread pool
+    # (the heavy lifting is NumPy/compiled-kernel work; threads avoid the
+    # process-spawn and pickling overhead that would dwarf each scenario).
+    # Small batches stay sequential - pool startup is not worth it.
+    scenario_args = [(params, retire_age, spouse_retire_age) for retire_age in retirement_ages]
+    if len(retirement_ages) < 4:
+        results = [_simulate_scenario(args) for args in scenario_args]
+    else:
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            results = list(executor.map(_simulate_scenario, scenario_args))
+
+    return [_scenario_row(params, retire_age, spouse_retire_age, result)
+            for retire_age, result in zip(retirement_ages, results)]
+
+
+def _scenario_row(params: Params, retire_age: float, spouse_retire_age: float,
+                  result: Result) -> dict:
+    """Build one compare_scenarios output row from a simulation result."""
+    return {
+        'retirement_age': retire_age,
+        'spouse_retirement_age': spouse_retire_age,
+        'feasible': result.ok,
+        'reason': result.reason,
+        'liquid_at_pension_start': result.liquid_at_pension_start,
+        'pension_at_start': result.pension_at_start,
+        'pension_income_month': result.pension_income_month,
+        'spouse_pension_at_start': result.spouse_pension_at_start,
+        'spouse_pension_income_month': result.spouse_pension_income_month,
+        'liquid_end': result.liquid_end,
+        'working_years': retire_age - params.age_now,
+        'spouse_working_years': spouse_retire_age - params.spouse_age_now
+    }
+
+
+def _compare_scenarios_feasibility(params: Params, retirement_ages: list[float],
+                                   spouse_retire_age: float) -> list[dict]:
+    """Feasibility-only scenario comparison exploiting monotonicity.
+
+    Feasibility is monotone non-decreasing in retire_age (working longer
+    only adds income and shortens retirement), so one bisection over the
+    sorted ages proves every age below the flip point infeasible without
+    simulating it. Rows for skipped ages carry the feasibility verdict with
+    zeroed metrics; probed ages get their full simulated result.
+    """
+    ages = sorted(retirement_ages)
+    probed: dict = {}
+
+    def run_candidate(i: int) -> Result:
+        result = _simulate_cached(ages[i], params, spouse_retire_age)
+        probed[i] = result
+        return result
+
+    first_feasible, _ = _bisect_first_feasible(len(ages), run_candidate)
+
+    rows = []
+    for i, retire_age in enumerate(ages):
+        if i in probed:
+            result = probed[i]
+        elif first_feasible is not None and i >= first_feasible:
+            result = Result(ok=True, reason='Feasible (later than first feasible age; not simulated)')
+        else:
+            result = Result(ok=False, reason='Infeasible (earlier than first feasible age; not simulated)')
+        rows.append(_scenario_row(params, retire_age, spouse_retire_age, result))
+    return rows
 
 
 def find_max_monthly_expense(
@@ -178,7 +462,8 @@ def find_max_monthly_expense(
     """
     Find the maximum monthly expense that results in target end assets.
 
-    Uses binary search to find the maximum monthly spending that:
+    Uses batched grid refinement (simulate_spend_batch evaluates a whole
+    candidate grid per kernel call) to find the maximum monthly spending that:
     1. Results in end assets >= target_end_assets
     2. Maintains feasibility (doesn't violate min_assets constraint)
 
@@ -207,76 +492,60 @@ def find_max_monthly_expense(
     older_age_now = max(params.age_now, params.spouse_age_now)
     total_months = round((params.end_age - older_age_now) * 12)
     
-    # Estimate upper bound: current liquid + all future income streams
-    # This is a conservative upper bound
-    max_estimate = params.liquid_now * 2 + (params.gross_income_month + params.spouse_gross_income_month) * total_months
-    high = max_estimate / total_months if total_months > 0 else 1000000.0
+    # Estimate upper bound: current liquid + all future income streams,
+    # following the income schedules instead of assuming today's salaries
+    # forever - a tighter bound means fewer bisection iterations
+    if total_months > 0:
+        months = np.arange(total_months)
+        income1 = _piecewise_from_schedule(params.age_now + months / 12,
+                                           params.gross_income_month,
+                                           params.income_schedule_arrays)
+        income2 = _piecewise_from_schedule(params.spouse_age_now + months / 12,
+                                           params.spouse_gross_income_month,
+                                           params.spouse_income_schedule_arrays)
+        max_estimate = params.liquid_now * 2 + income1.sum() + income2.sum()
+        high = max_estimate / total_months
+    else:
+        high = 1000000.0
 
     best_spend = None
-    best_result = None
-
-    # Binary search
-    for iteration in range(max_iterations):
-        mid = (low + high) / 2
-        
-        # Create modified params with this spending level
-        test_params = Params(
-            age_now=params.age_now,
-            retire_age=params.retire_age,
-            pension_start_age=params.pension_start_age,
-            income_schedule=params.income_schedule,
-            spouse_age_now=params.spouse_age_now,
-            spouse_retire_age=params.spouse_retire_age,
-            spouse_pension_start_age=params.spouse_pension_start_age,
-            spouse_income_schedule=params.spouse_income_schedule,
-            one_time_events=params.one_time_events,
-            expense_schedule=params.expense_schedule,
-            end_age=params.end_age,
-            r_annual_real=params.r_annual_real,
-            gross_income_month=params.gross_income_month,
-            pension_rate=params.pension_rate,
-            pension_rate_employer=params.pension_rate_employer,
-            hishtalmut_rate_employee=params.hishtalmut_rate_employee,
-            hishtalmut_rate_employer=params.hishtalmut_rate_employer,
-            hishtalmut_salary_cap=params.hishtalmut_salary_cap,
-            spouse_gross_income_month=params.spouse_gross_income_month,
-            spouse_pension_rate=params.spouse_pension_rate,
-            spouse_pension_rate_employer=params.spouse_pension_rate_employer,
-            spouse_hishtalmut_rate_employee=params.spouse_hishtalmut_rate_employee,
-            spouse_hishtalmut_rate_employer=params.spouse_hishtalmut_rate_employer,
-            spouse_hishtalmut_salary_cap=params.spouse_hishtalmut_salary_cap,
-            spend_month=mid,
-            liquid_now=params.liquid_now,
-            liquid_nontaxable_pct=params.liquid_nontaxable_pct,
-            min_assets=params.min_assets,
-            liquid_withdrawal_tax_rate=params.liquid_withdrawal_tax_rate,
-            pension_now=params.pension_now,
-            spouse_pension_now=params.spouse_pension_now,
-            mekadem=params.mekadem,
-            spouse_mekadem=params.spouse_mekadem,
-            old_age_pension_month=params.old_age_pension_month,
-            old_age_pension_start_age=params.old_age_pension_start_age,
-            pension_tax_free_amount=params.pension_tax_free_amount
-        )
-        
-        result = simulate(retire_age, test_params, spouse_retire_age)
-        
-        if result.ok and result.liquid_end >= target_end_assets - tolerance:
-            # This spending level works, try higher
-            best_spend = mid
-            best_result = result
-            low = mid
-        else:
-            # This spending level doesn't work, try lower
-            high = mid
-        
-        # Check convergence
-        if high - low < tolerance / 10:
+
+    # Grid refinement over the monotone acceptance condition (feasible and
+    # liquid_end above target): each pass evaluates a whole candidate grid
+    # in one batched kernel call and narrows the bracket to the cell around
+    # the last accepted candidate. A 33-point grid shrinks the bracket 32x
+    # per pass, so two-three passes reach the tolerance the serial bisection
+    # needed one simulation per halving for.
+    n_grid = 33
+    for _ in range(max_iterations):
+        candidates = np.linspace(low, high, n_grid)
+        feasible, liquid_end = simulate_spend_batch(
+            candidates, params, retire_age, spouse_retire_age)
+        with np.errstate(invalid='ignore'):  # violated rows carry NaN
+            accepted = feasible & (liquid_end >= target_end_assets - tolerance)
+        idx = np.flatnonzero(accepted)
+        if idx.size == 0:
             break
-    
-    # Verify the best result actually meets the target
-    if best_spend is not None and best_result is not None:
-        if best_result.ok and best_result.liquid_end >= target_end_assets - tolerance:
-            return best_spend, best_result
-    
+        best_spend = float(candidates[idx[-1]])
+        if idx[-1] == n_grid - 1:
+            # Even the upper-bound estimate is sustainable
+            break
+        low, high = best_spend, float(candidates[idx[-1] + 1])
+
+        # Check convergence: absolute gap for small brackets, relative gap
+        # for large ones (where the absolute criterion would burn extra
+        # passes narrowing digits nobody reads on a monthly budget)
+        if high - low < tolerance / 10 or (high - low) / max(low, 1.0) < 1e-4:
+            break
+
+    if best_spend is None:
+        return None, None
+
+    # Re-run the winner through simulate for the full Result, and verify it
+    # actually meets the target
+    best_result = _simulate_cached(
+        retire_age, dataclasses.replace(params, spend_month=best_spend), spouse_retire_age)
+    if best_result.ok and best_result.liquid_end >= target_end_assets - tolerance:
+        return best_spend, best_result
+
     return None, None
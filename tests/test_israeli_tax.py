@@ -16,65 +16,36 @@ from retire_sim.israeli_tax import (
 class TestIncomeTax:
     """Test income tax calculations."""
 
-    def test_zero_income(self):
-        """Zero income should have zero tax."""
-        assert calculate_income_tax(0) == 0.0
-
-    def test_lowest_bracket(self):
-        """Test income in lowest bracket (10%)."""
-        annual_income = 50000  # Below 84,120
-        expected_tax = 50000 * 0.10
-        assert calculate_income_tax(annual_income) == pytest.approx(expected_tax)
-
-    def test_second_bracket(self):
-        """Test income in second bracket (14%)."""
-        annual_income = 100000  # Between 84,120 and 120,720
-        expected_tax = 8412 + (100000 - 84120) * 0.14
-        assert calculate_income_tax(annual_income) == pytest.approx(expected_tax)
-
-    def test_third_bracket(self):
-        """Test income in third bracket (20%)."""
-        annual_income = 150000  # Between 120,720 and 193,800
-        expected_tax = 13536 + (150000 - 120720) * 0.20
-        assert calculate_income_tax(annual_income) == pytest.approx(expected_tax)
-
-    def test_high_income(self):
-        """Test income in highest bracket."""
-        annual_income = 1000000
+    @pytest.mark.parametrize("annual_income, expected_tax", [
+        pytest.param(0, 0.0, id="zero_income"),
+        # Below 84,120 (10%)
+        pytest.param(50000, 50000 * 0.10, id="lowest_bracket"),
+        # Between 84,120 and 120,720 (14%)
+        pytest.param(100000, 8412 + (100000 - 84120) * 0.14, id="second_bracket"),
+        # Between 120,720 and 193,800 (20%)
+        pytest.param(150000, 13536 + (150000 - 120720) * 0.20, id="third_bracket"),
         # Should use 50% bracket
-        expected_tax = 229203 + (1000000 - 721560) * 0.50
+        pytest.param(1000000, 229203 + (1000000 - 721560) * 0.50, id="high_income"),
+    ])
+    def test_brackets(self, annual_income, expected_tax):
+        """Test income tax in each bracket."""
         assert calculate_income_tax(annual_income) == pytest.approx(expected_tax)
 
 
 class TestNationalInsurance:
     """Test National Insurance calculations."""
 
-    def test_zero_income(self):
-        """Zero income should have zero NI."""
-        assert calculate_national_insurance(0) == 0.0
-
-    def test_low_income(self):
-        """Test income below threshold."""
-        monthly_income = 5000
-        expected_ni = 5000 * 0.0427
-        assert calculate_national_insurance(monthly_income) == pytest.approx(expected_ni)
-
-    def test_mid_income(self):
-        """Test income above threshold but below cap."""
-        monthly_income = 20000
-        low_part = 7522 * 0.0427
-        high_part = (20000 - 7522) * 0.1217
-        expected_ni = low_part + high_part
-        assert calculate_national_insurance(monthly_income) == pytest.approx(expected_ni)
-
-    def test_above_cap(self):
-        """Test income above cap."""
-        monthly_income = 60000  # Above cap of 50,695
-        # Should calculate on capped amount
-        capped = 50695
-        low_part = 7522 * 0.0427
-        high_part = (capped - 7522) * 0.1217
-        expected_ni = low_part + high_part
+    @pytest.mark.parametrize("monthly_income, expected_ni", [
+        pytest.param(0, 0.0, id="zero_income"),
+        # Below threshold of 7,522
+        pytest.param(5000, 5000 * 0.0427, id="low_income"),
+        # Above threshold but below cap
+        pytest.param(20000, 7522 * 0.0427 + (20000 - 7522) * 0.1217, id="mid_income"),
+        # Above cap of 50,695 - should calculate on capped amount
+        pytest.param(60000, 7522 * 0.0427 + (50695 - 7522) * 0.1217, id="above_cap"),
+    ])
+    def test_rates(self, monthly_income, expected_ni):
+        """Test NI below threshold, between threshold and cap, and above cap."""
         assert calculate_national_insurance(monthly_income) == pytest.approx(expected_ni)
 
 